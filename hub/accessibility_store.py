@@ -3,35 +3,57 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import yaml  # type: ignore[import]
+from .yaml_io import dump_yaml, load_yaml
 
 ACCESSIBILITY_PATH = Path(__file__).resolve().parent / "accessibility_profiles.yaml"
 
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+_DEFAULT_VOLUME = 0.7
+_SENSORY_FRIENDLY_VOLUME_CAP = 0.55
+_QUIET_HOURS_VOLUME_CAP = 0.45
+
+# Parsed profiles keyed by path, tagged with the (mtime_ns, size) they were read at.
+_PROFILES_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def load_profiles(path: Path | None = None) -> dict[str, Any]:
-    """Load accessibility profiles from disk."""
+    """
+    Load accessibility profiles from disk, reusing the parse while the file is unchanged.
+
+    The returned mapping is the shared cached parse: treat it as read-only and
+    ``copy.deepcopy`` it before applying presets or overrides in place.
+    """
     target = path or ACCESSIBILITY_PATH
-    if not target.exists():
+    try:
+        stat = target.stat()
+    except FileNotFoundError:
         return {"global": {}, "presets": {}, "per_node_overrides": {}}
-    with target.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _PROFILES_CACHE.get(target)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    data = load_yaml(target) or {}
     if not isinstance(data, dict):
         raise ValueError("Accessibility profiles file must contain a mapping.")
     data.setdefault("global", {})
     data.setdefault("presets", {})
     data.setdefault("per_node_overrides", {})
+    _PROFILES_CACHE[target] = (signature, data)
     return data
 
 
 def save_profiles(profiles: dict[str, Any], path: Path | None = None) -> None:
     """Persist accessibility profiles to disk."""
     target = path or ACCESSIBILITY_PATH
-    target.parent.mkdir(parents=True, exist_ok=True)
-    with target.open("w", encoding="utf-8") as handle:
-        yaml.safe_dump(profiles, handle, sort_keys=True)
+    _PROFILES_CACHE.pop(target, None)
+    dump_yaml(target, profiles)
 
 
 def apply_preset(profiles: dict[str, Any], preset_name: str) -> dict[str, Any]:
@@ -73,41 +95,80 @@ def derive_runtime_payloads(
     """Return node-specific configuration payloads derived from accessibility settings."""
     global_settings = _ensure_mapping(profiles.get("global"))
     overrides = _ensure_mapping(profiles.get("per_node_overrides"))
+    defaults = _resolve_global_defaults(global_settings)
+    default_accessibility = _default_accessibility_payload(defaults)
 
     payloads: dict[str, dict[str, Any]] = {}
     for node_id in nodes.keys():
         node_override = _ensure_mapping(overrides.get(node_id))
-        payloads[node_id] = _build_node_payload(global_settings, node_override)
+        if node_override:
+            payloads[node_id] = _build_node_payload(defaults, node_override)
+        else:
+            payloads[node_id] = {
+                "audio": {"volume": defaults.volume},
+                "accessibility": dict(default_accessibility),
+            }
     return payloads
 
 
+@dataclass(frozen=True, slots=True)
+class _GlobalDefaults:
+    """Global accessibility values resolved once per payload derivation."""
+
+    captions: bool
+    safety_limiter: bool
+    mobility_buffer_ms: int
+    pace: float
+    volume: float
+
+
+def _resolve_global_defaults(global_settings: Mapping[str, Any]) -> _GlobalDefaults:
+    sensory_friendly = bool(global_settings.get("sensory_friendly"))
+    volume = min(
+        _DEFAULT_VOLUME,
+        _SENSORY_FRIENDLY_VOLUME_CAP if sensory_friendly else _DEFAULT_VOLUME,
+        _QUIET_HOURS_VOLUME_CAP if global_settings.get("quiet_hours") else _DEFAULT_VOLUME,
+    )
+    return _GlobalDefaults(
+        captions=bool(global_settings.get("captions", False)),
+        safety_limiter=bool(global_settings.get("safety_limiter", True)),
+        mobility_buffer_ms=_clamp_int(global_settings.get("mobility_buffer_ms", 800), 0, 60000),
+        pace=0.9 if sensory_friendly else 1.0,
+        volume=volume,
+    )
+
+
+def _default_accessibility_payload(defaults: _GlobalDefaults) -> dict[str, Any]:
+    return {
+        "captions": defaults.captions,
+        "visual_pulse": False,
+        "proximity_glow": True,
+        "mobility_buffer_ms": defaults.mobility_buffer_ms,
+        "repeat": 0,
+        "pace": defaults.pace,
+        "safety_limiter": defaults.safety_limiter,
+    }
+
+
 def _build_node_payload(
-    global_settings: dict[str, Any],
-    node_override: dict[str, Any],
+    defaults: _GlobalDefaults,
+    node_override: Mapping[str, Any],
 ) -> dict[str, Any]:
-    captions = bool(node_override.get("captions", global_settings.get("captions", False)))
+    captions = bool(node_override.get("captions", defaults.captions))
     visual_pulse = bool(node_override.get("visual_pulse", False))
     proximity_glow = bool(node_override.get("proximity_glow", True))
-    default_buffer = _clamp_int(global_settings.get("mobility_buffer_ms", 800), 0, 60000)
     mobility_buffer_ms = _clamp_int(
-        node_override.get("mobility_buffer_ms", default_buffer),
+        node_override.get("mobility_buffer_ms", defaults.mobility_buffer_ms),
         0,
         60000,
     )
     repeat = _clamp_int(node_override.get("repeat", 0), 0, 2)
-    base_pace = 0.9 if global_settings.get("sensory_friendly") else 1.0
-    pace = _clamp_float(node_override.get("pace", base_pace), 0.85, 1.15)
-    safety_limiter = bool(
-        node_override.get("safety_limiter", global_settings.get("safety_limiter", True))
-    )
+    pace = _clamp_float(node_override.get("pace", defaults.pace), 0.85, 1.15)
+    safety_limiter = bool(node_override.get("safety_limiter", defaults.safety_limiter))
 
     volume = node_override.get("volume")
     if volume is None:
-        volume = 0.7
-        if global_settings.get("sensory_friendly"):
-            volume = min(volume, 0.55)
-        if global_settings.get("quiet_hours"):
-            volume = min(volume, 0.45)
+        volume = defaults.volume
     volume = _clamp_float(volume, 0.0, 1.0)
 
     accessibility_payload = {
@@ -126,26 +187,30 @@ def _build_node_payload(
     }
 
 
-def _ensure_mapping(candidate: Any) -> dict[str, Any]:
+def _ensure_mapping(candidate: Any) -> Mapping[str, Any]:
+    # Callers only read from the result, so mappings are passed through uncopied.
     if isinstance(candidate, Mapping):
-        return dict(candidate)
-    return {}
+        return candidate
+    return _EMPTY_MAPPING
 
 
 def _clamp_int(value: Any, minimum: int, maximum: int) -> int:
-    try:
-        number = int(value)
-    except (TypeError, ValueError):
-        number = minimum
-    return max(minimum, min(maximum, number))
+    if type(value) is not int:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return minimum
+    return minimum if value < minimum else (value if value <= maximum else maximum)
 
 
 def _clamp_float(value: Any, minimum: float, maximum: float) -> float:
-    try:
-        number = float(value)
-    except (TypeError, ValueError):
-        number = minimum
-    return max(minimum, min(maximum, number))
+    if type(value) is not float:
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return minimum
+    # Written so NaN compares false on both sides and clamps to the maximum.
+    return minimum if value < minimum else (value if value <= maximum else maximum)
 
 
 __all__ = [
@@ -9,12 +9,14 @@ from typing import Any
 
 import yaml  # type: ignore[import]
 
+from .yaml_io import load_yaml
+
 
 class ConfigError(RuntimeError):
     """Raised when a configuration file cannot be parsed or validated."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalyticsConfig:
     """Configuration values governing analytics logging."""
 
@@ -22,14 +24,14 @@ class AnalyticsConfig:
     rotation_daily: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NarrativeConfig:
     """Parameters that control the narrative unlock behaviour."""
 
     required_fragments_to_unlock: int = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SecurityConfig:
     """Settings that secure access to the administrative dashboard."""
 
@@ -38,7 +40,7 @@ class SecurityConfig:
     admin_pass_env: str = "ECHOTRACE_ADMIN_PASS"  # noqa: S105 - environment variable name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HubConfig:
     """Top-level hub configuration."""
 
@@ -55,17 +57,28 @@ class HubConfig:
 
 DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent / "config.yaml"
 
+# Validated configs keyed by path, tagged with the (mtime_ns, size) they were read at.
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], HubConfig]] = {}
+
 
 def load_config(path: Path | None = None) -> HubConfig:
-    """Load and validate the hub configuration file."""
+    """Load and validate the hub configuration file, cached until it changes on disk."""
     config_path = path or DEFAULT_CONFIG_PATH
 
-    if not config_path.exists():
-        raise ConfigError(f"Configuration file not found: {config_path}")
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError as exc:
+        raise ConfigError(f"Configuration file not found: {config_path}") from exc
+    except OSError as exc:
+        raise ConfigError(f"Unable to read configuration: {exc}") from exc
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
     try:
-        with config_path.open("r", encoding="utf-8") as handle:
-            parsed = yaml.safe_load(handle) or {}
+        parsed = load_yaml(config_path) or {}
     except yaml.YAMLError as exc:  # type: ignore[attr-defined]
         raise ConfigError(f"Failed to parse configuration: {exc}") from exc
     except OSError as exc:
@@ -74,102 +87,72 @@ def load_config(path: Path | None = None) -> HubConfig:
     if not isinstance(parsed, Mapping):
         raise ConfigError("Configuration root must be a mapping/object.")
 
-    broker_host = _require_str(parsed, "broker_host", default="localhost")
-    broker_port = _require_int(parsed, "broker_port", default=1883, minimum=1)
-    dashboard_host = _require_str(parsed, "dashboard_host", default="0.0.0.0")  # noqa: S104
-    dashboard_port = _require_int(parsed, "dashboard_port", default=8080, minimum=1)
-    default_language = _require_str(parsed, "default_language", default="en")
-    logs_dir_raw = _require_str(parsed, "logs_dir", default="hub/logs")
-    logs_dir = Path(logs_dir_raw)
+    root = _validate_fields(parsed, _ROOT_FIELDS)
+    logs_dir = Path(root.pop("logs_dir"))
     logs_dir.mkdir(parents=True, exist_ok=True)
 
-    analytics = _load_analytics(parsed.get("analytics"))
-    narrative = _load_narrative(parsed.get("narrative"))
-    security = _load_security(parsed.get("security"))
-
-    return HubConfig(
-        broker_host=broker_host,
-        broker_port=broker_port,
-        dashboard_host=dashboard_host,
-        dashboard_port=dashboard_port,
-        default_language=default_language,
+    config = HubConfig(
+        **root,
         logs_dir=logs_dir,
-        analytics=analytics,
-        narrative=narrative,
-        security=security,
-    )
-
-
-def _load_analytics(section: Any) -> AnalyticsConfig:
-    data = _coerce_mapping(section, "analytics")
-    enable_csv = _require_bool(data, "enable_csv", default=True)
-    rotation_daily = _require_bool(data, "rotation_daily", default=True)
-    return AnalyticsConfig(enable_csv=enable_csv, rotation_daily=rotation_daily)
-
-
-def _load_narrative(section: Any) -> NarrativeConfig:
-    data = _coerce_mapping(section, "narrative")
-    required = _require_int(data, "required_fragments_to_unlock", default=4, minimum=1)
-    return NarrativeConfig(required_fragments_to_unlock=required)
-
-
-def _load_security(section: Any) -> SecurityConfig:
-    data = _coerce_mapping(section, "security")
-    require_basic_auth = _require_bool(data, "require_basic_auth", default=True)
-    admin_user_env = _require_str(data, "admin_user_env", default="ECHOTRACE_ADMIN_USER")
-    admin_pass_env = _require_str(data, "admin_pass_env", default="ECHOTRACE_ADMIN_PASS")
-    return SecurityConfig(
-        require_basic_auth=require_basic_auth,
-        admin_user_env=admin_user_env,
-        admin_pass_env=admin_pass_env,
+        analytics=AnalyticsConfig(**_validate_section(parsed, "analytics", _ANALYTICS_FIELDS)),
+        narrative=NarrativeConfig(**_validate_section(parsed, "narrative", _NARRATIVE_FIELDS)),
+        security=SecurityConfig(**_validate_section(parsed, "security", _SECURITY_FIELDS)),
     )
-
-
-def _coerce_mapping(value: Any, label: str) -> dict[str, Any]:
-    if value is None:
-        return {}
-    if not isinstance(value, Mapping):
+    _CONFIG_CACHE[config_path] = (signature, config)
+    return config
+
+
+# Validation schema: (key, expected type, default, minimum for integers).
+_Field = tuple[str, type, Any, int | None]
+
+_ROOT_FIELDS: tuple[_Field, ...] = (
+    ("broker_host", str, "localhost", None),
+    ("broker_port", int, 1883, 1),
+    ("dashboard_host", str, "0.0.0.0", None),  # noqa: S104
+    ("dashboard_port", int, 8080, 1),
+    ("default_language", str, "en", None),
+    ("logs_dir", str, "hub/logs", None),
+)
+_ANALYTICS_FIELDS: tuple[_Field, ...] = (
+    ("enable_csv", bool, True, None),
+    ("rotation_daily", bool, True, None),
+)
+_NARRATIVE_FIELDS: tuple[_Field, ...] = (
+    ("required_fragments_to_unlock", int, 4, 1),
+)
+_SECURITY_FIELDS: tuple[_Field, ...] = (
+    ("require_basic_auth", bool, True, None),
+    ("admin_user_env", str, "ECHOTRACE_ADMIN_USER", None),
+    ("admin_pass_env", str, "ECHOTRACE_ADMIN_PASS", None),
+)
+_TYPE_LABELS = {str: "a non-empty string", int: "an integer", bool: "a boolean"}
+
+
+def _validate_section(
+    parsed: Mapping[str, Any],
+    label: str,
+    fields: tuple[_Field, ...],
+) -> dict[str, Any]:
+    section = parsed.get(label)
+    if section is None:
+        section = {}
+    elif not isinstance(section, Mapping):
         raise ConfigError(f"Section '{label}' must be a mapping/object.")
-    return dict(value)
-
-
-def _require_str(source: Mapping[str, Any], key: str, default: str | None = None) -> str:
-    value = source.get(key, default)
-    if value is None:
-        raise ConfigError(f"Missing configuration key: {key}")
-    if not isinstance(value, str) or not value:
-        raise ConfigError(f"Configuration key '{key}' must be a non-empty string.")
-    return value
-
-
-def _require_int(
-    source: Mapping[str, Any],
-    key: str,
-    default: int | None = None,
-    *,
-    minimum: int | None = None,
-) -> int:
-    value = source.get(key, default)
-    if value is None:
-        raise ConfigError(f"Missing configuration key: {key}")
-    if not isinstance(value, int):
-        raise ConfigError(f"Configuration key '{key}' must be an integer.")
-    if minimum is not None and value < minimum:
-        raise ConfigError(f"Configuration key '{key}' must be >= {minimum}.")
-    return value
-
-
-def _require_bool(
-    source: Mapping[str, Any],
-    key: str,
-    default: bool | None = None,
-) -> bool:
-    value = source.get(key, default)
-    if value is None:
-        raise ConfigError(f"Missing configuration key: {key}")
-    if not isinstance(value, bool):
-        raise ConfigError(f"Configuration key '{key}' must be a boolean.")
-    return value
+    return _validate_fields(section, fields)
+
+
+def _validate_fields(source: Mapping[str, Any], fields: tuple[_Field, ...]) -> dict[str, Any]:
+    values: dict[str, Any] = {}
+    for key, kind, default, minimum in fields:
+        value = source.get(key, default)
+        if value is None:
+            raise ConfigError(f"Missing configuration key: {key}")
+        if not isinstance(value, kind) or (kind is str and not value):
+            raise ConfigError(f"Configuration key '{key}' must be {_TYPE_LABELS[kind]}.")
+        if minimum is not None and isinstance(value, int) and value < minimum:
+            raise ConfigError(f"Configuration key '{key}' must be >= {minimum}.")
+        values[key] = value
+    return values
 
 
 __all__ = [
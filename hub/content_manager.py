@@ -3,26 +3,42 @@
 from __future__ import annotations
 
 import logging
+import os
+import sys
 from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml  # type: ignore[import]
 
+from .yaml_io import load_yaml
+
 LOGGER = logging.getLogger(__name__)
 
+_NO_MEDIA: Mapping[str, MediaAsset] = MappingProxyType({})
+
+# Canonical role strings shared by every parsed node entry.
+_ROLES: dict[str, str] = {role: sys.intern(role) for role in ("whisper", "mystery")}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MediaAsset:
-    """Describe audio and transcript resources for a node-language pair."""
+    """Describe audio and transcript resources for a node-language pair.
+
+    Existence flags are captured when the pack is loaded; call
+    ``ContentManager.invalidate`` after replacing files on disk.
+    """
 
     audio_path: Path
     transcript_path: Path
     transcript_filename: str
+    audio_exists: bool = True
+    transcript_exists: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentPack:
     """Rich representation of a content pack and its assets."""
 
@@ -31,6 +47,9 @@ class ContentPack:
     nodes: dict[str, dict[str, str]]
     media: dict[tuple[str, str], MediaAsset]
     base_url: str
+    effective_media: dict[str, dict[str, MediaAsset]] = field(default_factory=dict)
+    default_languages: dict[str, str] = field(default_factory=dict)
+    default_assignments: dict[str, MediaAsset] = field(default_factory=dict)
 
 
 class ContentManager:
@@ -40,17 +59,31 @@ class ContentManager:
         self,
         packs_root: Path | None = None,
         transcripts_base: str = "/transcripts",
+        *,
+        resolve_symlinks: bool = False,
     ) -> None:
         self._packs_root = packs_root or Path("content-packs")
         self._packs_root.mkdir(parents=True, exist_ok=True)
         self._transcripts_base = transcripts_base.rstrip("/")
+        self._resolve_symlinks = resolve_symlinks
         self._active_pack: ContentPack | None = None
+        self._pack_names: tuple[int, list[str]] | None = None
+        self._pack_cache: dict[str, tuple[tuple[int, int], ContentPack]] = {}
+        self._logged_media_issues: set[tuple[str, str, str]] = set()
 
     def list_packs(self) -> list[str]:
         """Return discovered content pack directory names."""
-        if not self._packs_root.exists():
+        try:
+            root_mtime = self._packs_root.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._pack_names = None
             return []
-        return sorted(item.name for item in self._packs_root.iterdir() if item.is_dir())
+        cached = self._pack_names
+        if cached is None or cached[0] != root_mtime:
+            with os.scandir(self._packs_root) as entries:
+                names = sorted(entry.name for entry in entries if entry.is_dir())
+            cached = self._pack_names = (root_mtime, names)
+        return list(cached[1])
 
     def load_pack(self, name: str) -> ContentPack:
         """Load and validate the specified content pack."""
@@ -58,12 +91,18 @@ class ContentManager:
         if not pack_path.exists():
             raise FileNotFoundError(f"Content pack '{name}' not found at {pack_path}")
         pack_yaml = pack_path / "pack.yaml"
-        if not pack_yaml.exists():
-            raise FileNotFoundError(f"pack.yaml missing for content pack '{name}'")
+        try:
+            stat = pack_yaml.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"pack.yaml missing for content pack '{name}'") from None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._pack_cache.get(name)
+        if cached is not None and cached[0] == signature:
+            return self._activate(cached[1])
 
         try:
-            with pack_yaml.open("r", encoding="utf-8") as handle:
-                raw = yaml.safe_load(handle) or {}
+            raw = load_yaml(pack_yaml) or {}
         except yaml.YAMLError as exc:
             raise ValueError(f"Failed to parse pack.yaml for '{name}': {exc}") from exc
 
@@ -79,9 +118,26 @@ class ContentManager:
         media = self._parse_media(pack_path, raw.get("media", {}))
         base_url = f"{self._transcripts_base}/{name}"
 
-        pack = ContentPack(name=name, root=pack_path, nodes=nodes, media=media, base_url=base_url)
-        self._active_pack = pack
-        return pack
+        default_languages = {
+            node_id: meta["default_language"] for node_id, meta in nodes.items()
+        }
+
+        pack = ContentPack(
+            name=name,
+            root=pack_path,
+            nodes=nodes,
+            media=media,
+            base_url=base_url,
+            effective_media=_build_effective_media(media, default_languages),
+            default_languages=default_languages,
+            default_assignments={
+                node_id: media[(node_id, lang)]
+                for node_id, lang in default_languages.items()
+                if (node_id, lang) in media
+            },
+        )
+        self._pack_cache[name] = (signature, pack)
+        return self._activate(pack)
 
     def get_fragment_for_node(self, node_id: str, language: str) -> Path | None:
         """Return the audio fragment path for a given node and language."""
@@ -89,8 +145,10 @@ class ContentManager:
         asset = self._resolve_media_asset(pack, node_id, language)
         if asset is None:
             return None
-        if not asset.audio_path.is_file():
-            LOGGER.warning(
+        if not asset.audio_exists:
+            self._log_once(
+                ("audio", node_id, language),
+                logging.WARNING,
                 "Audio asset missing for %s (%s): %s",
                 node_id,
                 language,
@@ -105,8 +163,10 @@ class ContentManager:
         asset = self._resolve_media_asset(pack, node_id, language)
         if asset is None:
             return None
-        if not asset.transcript_path.is_file():
-            LOGGER.warning(
+        if not asset.transcript_exists:
+            self._log_once(
+                ("transcript", node_id, language),
+                logging.WARNING,
                 "Transcript asset missing for %s (%s): %s",
                 node_id,
                 language,
@@ -115,6 +175,26 @@ class ContentManager:
             return None
         return f"{pack.base_url}/{asset.transcript_filename}"
 
+    def invalidate(self) -> ContentPack | None:
+        """Reload the active pack so asset existence reflects files swapped on disk."""
+        if self._active_pack is None:
+            return None
+        name = self._active_pack.name
+        self._pack_cache.pop(name, None)
+        return self.load_pack(name)
+
+    def _activate(self, pack: ContentPack) -> ContentPack:
+        self._active_pack = pack
+        self._logged_media_issues.clear()
+        return pack
+
+    def _log_once(self, key: tuple[str, str, str], level: int, msg: str, *args: Any) -> None:
+        """Log a per-request media problem once per loaded pack rather than per request."""
+        if key in self._logged_media_issues or not LOGGER.isEnabledFor(level):
+            return
+        self._logged_media_issues.add(key)
+        LOGGER.log(level, msg, *args)
+
     def _require_active_pack(self) -> ContentPack:
         if self._active_pack is None:
             raise RuntimeError("No content pack is currently loaded.")
@@ -126,24 +206,34 @@ class ContentManager:
         node_id: str,
         language: str,
     ) -> MediaAsset | None:
-        asset = pack.media.get((node_id, language))
+        node_media = pack.effective_media.get(node_id, _NO_MEDIA)
+        asset = node_media.get(language)
         if asset:
             return asset
-        node_meta = pack.nodes.get(node_id)
-        if not node_meta:
-            LOGGER.warning("Node '%s' not defined in pack '%s'.", node_id, pack.name)
+        default_lang = pack.default_languages.get(node_id)
+        if default_lang is None:
+            self._log_once(
+                ("node", node_id, ""),
+                logging.WARNING,
+                "Node '%s' not defined in pack '%s'.",
+                node_id,
+                pack.name,
+            )
             return None
-        default_lang = node_meta.get("default_language", language)
-        asset = pack.media.get((node_id, default_lang))
+        asset = node_media.get(default_lang)
         if asset:
-            LOGGER.info(
+            self._log_once(
+                ("fallback", node_id, language),
+                logging.INFO,
                 "Falling back to default language '%s' for node '%s' (requested '%s').",
                 default_lang,
                 node_id,
                 language,
             )
         else:
-            LOGGER.warning(
+            self._log_once(
+                ("media", node_id, language),
+                logging.WARNING,
                 "Media asset missing for node '%s' language '%s' (no fallback available).",
                 node_id,
                 language,
@@ -175,15 +265,15 @@ class ContentManager:
                 continue
             role = str(node_meta.get("role", "")).strip()
             default_lang = str(node_meta.get("default_language", "")).strip()
-            if role not in {"whisper", "mystery"}:
+            if role not in _ROLES:
                 LOGGER.warning("Node '%s' has unsupported role '%s'.", node_id_raw, role)
                 continue
             if not default_lang:
                 LOGGER.warning("Node '%s' missing default_language.", node_id_raw)
                 continue
-            nodes[node_id_raw] = {
-                "role": role,
-                "default_language": default_lang,
+            nodes[sys.intern(node_id_raw)] = {
+                "role": _ROLES[role],
+                "default_language": sys.intern(default_lang),
             }
         return nodes
 
@@ -197,11 +287,17 @@ class ContentManager:
             LOGGER.warning("Media section missing or malformed in pack metadata.")
             return media
 
+        root = os.path.abspath(pack_path)
+        listings: dict[str, frozenset[str]] = {}
         for node_id, language_map in raw_media.items():
             if not isinstance(language_map, Mapping):
                 LOGGER.warning("Media entry for node '%s' must be a mapping.", node_id)
                 continue
+            if isinstance(node_id, str):
+                node_id = sys.intern(node_id)
             for lang, asset_meta in language_map.items():
+                if isinstance(lang, str):
+                    lang = sys.intern(lang)
                 if not isinstance(asset_meta, Mapping):
                     LOGGER.warning("Media entry for %s (%s) must be a mapping.", node_id, lang)
                     continue
@@ -210,18 +306,77 @@ class ContentManager:
                 if not audio_rel or not transcript_rel:
                     LOGGER.warning("Media entry for %s (%s) missing paths.", node_id, lang)
                     continue
-                audio_path = (pack_path / audio_rel).resolve()
-                transcript_path = (pack_path / transcript_rel).resolve()
+                audio_str = os.path.normpath(os.path.join(root, audio_rel))
+                transcript_str = os.path.normpath(os.path.join(root, transcript_rel))
+                if self._resolve_symlinks:
+                    audio_str = os.path.realpath(audio_str)
+                    transcript_str = os.path.realpath(transcript_str)
+                audio_path = Path(audio_str)
+                transcript_path = Path(transcript_str)
+                audio_exists = _listed_file_exists(audio_str, listings)
+                transcript_exists = _listed_file_exists(transcript_str, listings)
                 media[(node_id, lang)] = MediaAsset(
                     audio_path=audio_path,
                     transcript_path=transcript_path,
                     transcript_filename=transcript_path.name,
+                    audio_exists=audio_exists,
+                    transcript_exists=transcript_exists,
                 )
-                if not audio_path.exists():
+                if not audio_exists:
                     LOGGER.warning("Audio file not found: %s", audio_path)
-                if not transcript_path.exists():
+                if not transcript_exists:
                     LOGGER.warning("Transcript file not found: %s", transcript_path)
         return media
 
 
+def _build_effective_media(
+    media: Mapping[tuple[str, str], MediaAsset],
+    default_languages: Mapping[str, str],
+) -> dict[str, dict[str, MediaAsset]]:
+    """Index media per node, filling languages a node lacks with its default-language asset."""
+    effective: dict[str, dict[str, MediaAsset]] = {}
+    languages: set[str] = set()
+    for (node_id, lang), asset in media.items():
+        effective.setdefault(node_id, {})[lang] = asset
+        if isinstance(lang, str):
+            languages.add(lang)
+        else:
+            LOGGER.warning(
+                "Language key %r for node '%s' is not a string; excluded from fallback filling.",
+                lang,
+                node_id,
+            )
+
+    for node_id, default_lang in default_languages.items():
+        node_media = effective.get(node_id)
+        fallback = node_media.get(default_lang) if node_media else None
+        if node_media is None or fallback is None:
+            continue
+        missing = sorted(languages.difference(node_media))
+        for lang in missing:
+            node_media[lang] = fallback
+        if missing:
+            LOGGER.info(
+                "Node '%s' falls back to default language '%s' for: %s.",
+                node_id,
+                default_lang,
+                ", ".join(map(str, missing)),
+            )
+    return effective
+
+
+def _listed_file_exists(path: str, listings: dict[str, frozenset[str]]) -> bool:
+    """Check for a regular file using one directory scan per parent directory."""
+    directory, filename = os.path.split(path)
+    names = listings.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            names = frozenset()
+        listings[directory] = names
+    return filename in names
+
+
 __all__ = ["ContentManager", "ContentPack", "MediaAsset"]
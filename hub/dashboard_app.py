@@ -2,27 +2,33 @@
 
 from __future__ import annotations
 
+import copy
 import functools
+import hashlib
 import hmac
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Optional, TypeVar, Union, cast
+from typing import Any, Callable, TypeVar, cast
 
 from flask import (
     Flask,
     Request,
     Response,
     abort,
-    jsonify,
     redirect,
     render_template,
     request,
     send_file,
+    send_from_directory,
     url_for,
 )
+from jinja2 import FileSystemBytecodeCache
 
+from . import json_codec
 from .accessibility_store import (
     ACCESSIBILITY_PATH,
     apply_preset,
@@ -32,10 +38,53 @@ from .accessibility_store import (
     set_per_node_override,
 )
 from .config_loader import HubConfig, load_config
-from .content_manager import ContentManager, ContentPack, MediaAsset
-from .event_logging import CsvEventLogger, summarize_events
+from .content_manager import ContentManager, ContentPack
+from .event_logging import latest_event_csv, summarize_events
 from .narrative_state import NarrativeState
 
+LOGGER = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+
+class PayloadCache:
+    """Short-lived memo for read-only API payloads that dashboards poll."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def get_or_compute(self, key: str, timeout: float, compute: Callable[[], Any]) -> Any:
+        """Return the cached payload for ``key`` or compute and keep it for ``timeout`` seconds."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        value = compute()
+        self._entries[key] = (now + timeout, value)
+        return value
+
+    def discard(self, *keys: str) -> None:
+        """Drop the cached payloads a state change made stale."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached payload."""
+        self._entries.clear()
+
+
+API_CACHE_TIMEOUT_SECONDS = 2.0
+ANALYTICS_CACHE_TIMEOUT_SECONDS = 30.0
+PAGE_CACHE_TIMEOUT_SECONDS = 60.0
+PUSH_MAX_WORKERS = 8
+HEALTH_RESPONSE_BODY = b'{"ok":true}'
+MAX_JSON_BYTES = 64 * 1024
+
+# Cached entries derived from accessibility profiles and from the active pack, respectively.
+ACCESSIBILITY_CACHE_KEYS = ("template_globals", "page:accessibility")
+PACK_CACHE_KEYS = ("template_globals", "page:accessibility", "page:calibration", "page:content")
+
 
 @dataclass
 class DashboardContext:
@@ -47,20 +96,37 @@ class DashboardContext:
     narrative_state: NarrativeState
     current_pack: ContentPack | None = None
     health_snapshot: dict[str, float] = field(default_factory=dict)
-    hub_controller: Optional[Any] = None
+    hub_controller: Any | None = None
+    api_cache: PayloadCache = field(default_factory=PayloadCache)
+    _push_pool: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
+
+    def list_packs(self) -> list[str]:
+        # ContentManager caches the listing until the packs directory changes.
+        return self.content_manager.list_packs()
 
     def select_pack(self, pack_name: str) -> ContentPack:
         pack = self.content_manager.load_pack(pack_name)
         self.current_pack = pack
+        self.api_cache.discard(*PACK_CACHE_KEYS)
+        return pack
+
+    def refresh_content(self) -> ContentPack | None:
+        """Re-scan the active pack's assets and drop the pages rendered from it."""
+        pack = self.content_manager.invalidate()
+        if pack is not None:
+            self.current_pack = pack
+        self.api_cache.discard(*PACK_CACHE_KEYS)
         return pack
 
     def reload_accessibility(self) -> None:
-        self.accessibility = load_profiles(ACCESSIBILITY_PATH)
+        # Routes edit the profiles in place, so keep a private copy of the cached parse.
+        self.accessibility = copy.deepcopy(load_profiles(ACCESSIBILITY_PATH))
+        self.api_cache.discard(*ACCESSIBILITY_CACHE_KEYS)
 
     def push_config_to_node(self, node_id: str, payload: dict[str, Any]) -> bool:
         controller = self.hub_controller
         if controller is None:
-            logging.getLogger(__name__).debug(
+            LOGGER.debug(
                 "No hub controller configured; assuming config push to %s succeeded.",
                 node_id,
             )
@@ -68,17 +134,28 @@ class DashboardContext:
         try:
             return bool(controller.push_node_config(node_id, payload))
         except Exception as exc:  # pragma: no cover - defensive logging
-            logging.getLogger(__name__).warning("Failed to push config to %s: %s", node_id, exc)
+            LOGGER.warning("Failed to push config to %s: %s", node_id, exc)
             return False
 
     def push_accessibility_configs(self) -> dict[str, bool]:
         if not self.current_pack:
             return {}
         payloads = derive_runtime_payloads(self.accessibility, self.current_pack.nodes)
-        results: dict[str, bool] = {}
-        for node_id, payload in payloads.items():
-            results[node_id] = self.push_config_to_node(node_id, payload)
-        return results
+        if len(payloads) <= 1:
+            return {
+                node_id: self.push_config_to_node(node_id, payload)
+                for node_id, payload in payloads.items()
+            }
+        # Each push may wait on an MQTT acknowledgement, so overlap the waits.
+        if self._push_pool is None:
+            self._push_pool = ThreadPoolExecutor(
+                max_workers=PUSH_MAX_WORKERS, thread_name_prefix="config-push"
+            )
+        futures = {
+            node_id: self._push_pool.submit(self.push_config_to_node, node_id, payload)
+            for node_id, payload in payloads.items()
+        }
+        return {node_id: future.result() for node_id, future in futures.items()}
 
 
 def create_app(config: HubConfig | None = None, hub_controller: Any | None = None) -> Flask:
@@ -87,11 +164,13 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
 
     app = Flask(
         __name__,
-        template_folder=str(Path(__file__).resolve().parent / "templates"),
-        static_folder=str(Path(__file__).resolve().parent / "static"),
+        template_folder=str(TEMPLATE_DIR),
+        static_folder=str(STATIC_DIR),
     )
 
-    accessibility = load_profiles(ACCESSIBILITY_PATH)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+    accessibility = copy.deepcopy(load_profiles(ACCESSIBILITY_PATH))
     context = DashboardContext(
         config=hub_config,
         content_manager=ContentManager(),
@@ -102,7 +181,7 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
         hub_controller=hub_controller,
     )
 
-    available_packs = context.content_manager.list_packs()
+    available_packs = context.list_packs()
     if available_packs:
         try:
             context.select_pack(available_packs[0])
@@ -112,7 +191,7 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
     app.config["DASHBOARD_CONTEXT"] = context
     app.config["HUB_CONTROLLER"] = hub_controller
 
-    credentials: Optional[tuple[str, str]] = None
+    credentials: tuple[str, str] | None = None
     if hub_config.security.require_basic_auth:
         username = os.getenv(hub_config.security.admin_user_env)
         password = os.getenv(hub_config.security.admin_pass_env)
@@ -121,35 +200,32 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
                 "Basic authentication is required but administrator credentials are not configured."
             )
         credentials = (username, password)
+    expected_blob = _credentials_blob(*credentials) if credentials is not None else None
     app.config["ADMIN_CREDENTIALS"] = credentials
-
-    def get_context() -> DashboardContext:
-        return cast(DashboardContext, app.config["DASHBOARD_CONTEXT"])
+    app.config["ADMIN_CREDENTIALS_BLOB"] = expected_blob
 
     RouteReturn = Response | str | tuple[Response, int] | tuple[Response, int, dict[str, Any]]
     F = TypeVar("F", bound=Callable[..., RouteReturn])
 
     def require_auth(func: F) -> F:
+        # Auth settings are fixed per app, so open deployments skip the wrapper entirely.
+        if expected_blob is None:
+            return func
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> RouteReturn:
-            expected = cast(Optional[tuple[str, str]], app.config.get("ADMIN_CREDENTIALS"))
-            if not expected:
-                return func(*args, **kwargs)
             auth = request.authorization
             if not auth:
                 return _auth_required_response()
-            if not (
-                hmac.compare_digest(auth.username, expected[0])
-                and hmac.compare_digest(auth.password, expected[1])
-            ):
+            provided = _credentials_blob(auth.username or "", auth.password or "")
+            if not hmac.compare_digest(provided, cast(bytes, expected_blob)):
                 return _auth_required_response()
             return func(*args, **kwargs)
 
         return cast(F, wrapper)
 
-    @app.context_processor
-    def inject_globals() -> dict[str, Any]:
-        ctx = get_context()
+    def build_template_globals() -> dict[str, Any]:
+        ctx = context
         accessibility_global = ctx.accessibility.get("global", {})
         global_view = accessibility_global if isinstance(accessibility_global, dict) else {}
         return {
@@ -159,38 +235,47 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
             "active_pack": ctx.current_pack,
         }
 
+    @app.context_processor
+    def inject_globals() -> dict[str, Any]:
+        # Rebuilt only after a pack switch or profile change discards the cached globals.
+        return cast(
+            dict[str, Any],
+            context.api_cache.get_or_compute(
+                "template_globals", PAGE_CACHE_TIMEOUT_SECONDS, build_template_globals
+            ),
+        )
+
     # ------------------------------------------------------------------ Routes
 
     @app.route("/health")
     def health() -> Response:
         """Return a simple JSON response indicating the app is healthy."""
-        return jsonify({"ok": True})
+        return Response(
+            HEALTH_RESPONSE_BODY,
+            mimetype="application/json",
+            headers={"Cache-Control": "no-store"},
+        )
 
     @app.route("/")
     @require_auth
     def index() -> str:
-        ctx = get_context()
+        ctx = context
         state = ctx.narrative_state.snapshot()
         return render_template(
             "index.html",
             state=state,
             active_pack=ctx.current_pack,
-            available_packs=ctx.content_manager.list_packs(),
+            available_packs=ctx.list_packs(),
         )
 
     @app.route("/nodes")
     @require_auth
     def nodes() -> str:
-        ctx = get_context()
+        ctx = context
         pack = ctx.current_pack
         nodes = pack.nodes if pack else {}
         health = ctx.health_snapshot
-        assignments: dict[str, MediaAsset] = {}
-        if pack:
-            for (node_id, lang), asset in pack.media.items():
-                default_lang = nodes.get(node_id, {}).get("default_language")
-                if default_lang == lang:
-                    assignments[node_id] = asset
+        assignments = pack.default_assignments if pack else {}
         return render_template(
             "nodes.html",
             nodes=nodes,
@@ -201,38 +286,64 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
     @app.route("/accessibility")
     @require_auth
     def accessibility_page() -> str:
-        ctx = get_context()
+        ctx = context
         profiles = ctx.accessibility
-        return render_template(
-            "accessibility.html",
-            profiles=profiles,
-            nodes=ctx.current_pack.nodes if ctx.current_pack else {},
+        # Pages that only show pack and profile data are cached until a mutating route
+        # discards them; live health and narrative pages are always rendered.
+        return cast(
+            str,
+            ctx.api_cache.get_or_compute(
+                "page:accessibility",
+                PAGE_CACHE_TIMEOUT_SECONDS,
+                lambda: render_template(
+                    "accessibility.html",
+                    profiles=profiles,
+                    nodes=ctx.current_pack.nodes if ctx.current_pack else {},
+                ),
+            ),
         )
 
     @app.route("/calibration")
     @require_auth
     def calibration() -> str:
-        ctx = get_context()
+        ctx = context
         pack = ctx.current_pack
         nodes = pack.nodes if pack else {}
-        return render_template("calibration.html", nodes=nodes)
+        return cast(
+            str,
+            ctx.api_cache.get_or_compute(
+                "page:calibration",
+                PAGE_CACHE_TIMEOUT_SECONDS,
+                lambda: render_template("calibration.html", nodes=nodes),
+            ),
+        )
 
     @app.route("/content")
     @require_auth
     def content() -> str:
-        ctx = get_context()
+        ctx = context
         pack = ctx.current_pack
-        all_packs = ctx.content_manager.list_packs()
-        return render_template(
-            "content.html",
-            active_pack=pack,
-            pack_names=all_packs,
+        all_packs = ctx.list_packs()
+
+        def render() -> tuple[list[str], str]:
+            page = render_template("content.html", active_pack=pack, pack_names=all_packs)
+            return all_packs, page
+
+        rendered_for, page = ctx.api_cache.get_or_compute(
+            "page:content", PAGE_CACHE_TIMEOUT_SECONDS, render
         )
+        if rendered_for != all_packs:
+            # A pack directory appeared or vanished; replace the single cached page.
+            ctx.api_cache.discard("page:content")
+            _, page = ctx.api_cache.get_or_compute(
+                "page:content", PAGE_CACHE_TIMEOUT_SECONDS, render
+            )
+        return cast(str, page)
 
     @app.route("/analytics")
     @require_auth
     def analytics() -> str:
-        ctx = get_context()
+        ctx = context
         state = ctx.narrative_state.snapshot()
         return render_template(
             "analytics.html",
@@ -243,26 +354,37 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
     @app.route("/api/health")
     @require_auth
     def api_health() -> Response:
-        ctx = get_context()
-        return jsonify({"nodes": ctx.health_snapshot})
+        ctx = context
+        payload = ctx.api_cache.get_or_compute(
+            "health",
+            API_CACHE_TIMEOUT_SECONDS,
+            lambda: {"nodes": dict(ctx.health_snapshot)},
+        )
+        return _json_with_etag(payload)
 
     @app.route("/api/state")
     @require_auth
     def api_state() -> Response:
-        ctx = get_context()
-        return jsonify(ctx.narrative_state.snapshot())
+        ctx = context
+        payload = ctx.api_cache.get_or_compute(
+            "state",
+            API_CACHE_TIMEOUT_SECONDS,
+            ctx.narrative_state.snapshot,
+        )
+        return _json_with_etag(payload)
 
     @app.route("/api/reset-state", methods=["POST"])
     @require_auth
     def api_reset_state() -> Response:
-        ctx = get_context()
+        ctx = context
         ctx.narrative_state.reset()
-        return jsonify({"ok": True, "state": ctx.narrative_state.snapshot()})
+        ctx.api_cache.discard("state")
+        return _json({"ok": True, "state": ctx.narrative_state.snapshot()})
 
     @app.route("/api/push-config", methods=["POST"])
     @require_auth
     def api_push_config() -> Response:
-        ctx = get_context()
+        ctx = context
         data = _require_json(request)
         node_id = _require_field(data, "node_id")
         payload = data.get("payload")
@@ -270,12 +392,12 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
             abort(400, description="payload must be an object")
         app.logger.info("Configuration push requested for %s: %s", node_id, payload)
         acknowledged = ctx.push_config_to_node(node_id, payload)
-        return jsonify({"ok": acknowledged, "acknowledged": acknowledged, "node_id": node_id})
+        return _json({"ok": acknowledged, "acknowledged": acknowledged, "node_id": node_id})
 
     @app.route("/api/apply-preset", methods=["POST"])
     @require_auth
     def api_apply_preset() -> Response:
-        ctx = get_context()
+        ctx = context
         data = _require_json(request)
         preset_name = data.get("preset_name")
         profiles = ctx.accessibility
@@ -293,10 +415,11 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
         else:
             abort(400, description="Provide preset_name or global settings to apply.")
 
+        # The in-memory profiles are authoritative; no need to re-read what was just written.
         save_profiles(profiles, ACCESSIBILITY_PATH)
-        ctx.reload_accessibility()
+        ctx.api_cache.discard(*ACCESSIBILITY_CACHE_KEYS)
         push_results = ctx.push_accessibility_configs()
-        return jsonify(
+        return _json(
             {
                 "ok": True,
                 "global": ctx.accessibility.get("global", {}),
@@ -307,7 +430,7 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
     @app.route("/api/accessibility/override", methods=["POST"])
     @require_auth
     def api_accessibility_override() -> Response:
-        ctx = get_context()
+        ctx = context
         data = _require_json(request)
         node_id = _require_field(data, "node_id")
         overrides = data.get("overrides")
@@ -316,15 +439,15 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
 
         set_per_node_override(ctx.accessibility, node_id, overrides)
         save_profiles(ctx.accessibility, ACCESSIBILITY_PATH)
-        ctx.reload_accessibility()
+        ctx.api_cache.discard(*ACCESSIBILITY_CACHE_KEYS)
         push_results = ctx.push_accessibility_configs()
         per_node = ctx.accessibility.get("per_node_overrides", {}).get(node_id, {})
-        return jsonify({"ok": True, "overrides": per_node, "push": push_results})
+        return _json({"ok": True, "overrides": per_node, "push": push_results})
 
     @app.route("/api/select-pack", methods=["POST"])
     @require_auth
     def api_select_pack() -> Response:
-        ctx = get_context()
+        ctx = context
         data = _require_json(request)
         pack_name = _require_field(data, "pack_name")
         try:
@@ -334,61 +457,98 @@ def create_app(config: HubConfig | None = None, hub_controller: Any | None = Non
         except ValueError as exc:
             abort(400, description=str(exc))
         push_results = ctx.push_accessibility_configs()
-        return jsonify({"ok": True, "pack": pack.name, "push": push_results})
+        return _json({"ok": True, "pack": pack.name, "push": push_results})
 
     @app.route("/api/export-csv")
     @require_auth
     def api_export_csv() -> Response:
-        ctx = get_context()
-        logger = CsvEventLogger(ctx.config.logs_dir)
-        latest = logger.latest_csv()
-        logger.close()
+        ctx = context
+        latest = latest_event_csv(ctx.config.logs_dir)
         if latest is None or not latest.exists():
             abort(404, description="No analytics CSV available yet.")
         return send_file(latest, mimetype="text/csv", as_attachment=True, download_name=latest.name)
 
     @app.route("/api/analytics/summary")
     @require_auth
-    def api_analytics_summary() -> Response | tuple[Response, int]:
-        ctx = get_context()
-        summary = summarize_events(ctx.config.logs_dir)
-        if summary is None:
-            return jsonify({"ok": False, "message": "No analytics available."}), 404
-        return jsonify(
-            {
-                "ok": True,
-                "by_node": summary.by_node,
-                "heartbeat_by_node": summary.heartbeat_by_node,
-                "narrative_unlocks": summary.narrative_unlocks,
-                "total_triggers": summary.total_triggers,
-                "completion_rate": summary.completion_rate,
-                "mean_trigger_interval_seconds": summary.mean_trigger_interval_seconds,
-                "recent_events": summary.recent_events,
-            }
+    def api_analytics_summary() -> Response:
+        ctx = context
+        payload = ctx.api_cache.get_or_compute(
+            "analytics_summary",
+            ANALYTICS_CACHE_TIMEOUT_SECONDS,
+            lambda: _analytics_summary_payload(ctx.config.logs_dir),
         )
+        if payload is None:
+            return _json({"ok": False, "message": "No analytics available."}, status=404)
+        return _json_with_etag(payload)
 
     @app.route("/transcripts/<pack_name>/<path:filename>")
     def serve_transcript(pack_name: str, filename: str) -> Response:
         if Path(filename).suffix.lower() != ".html":
             abort(404)
-        base_dir = (Path("content-packs") / pack_name / "transcripts").resolve()
-        target_path = (base_dir / filename).resolve()
-        if base_dir not in target_path.parents and target_path != base_dir:
-            abort(404)
-        if not target_path.exists():
-            abort(404)
-        return send_file(target_path, mimetype="text/html")
+        # send_from_directory rejects traversal and answers conditional GETs with 304.
+        return send_from_directory(
+            _transcript_base(pack_name),
+            filename,
+            mimetype="text/html",
+            conditional=True,
+            etag=True,
+        )
 
     @app.route("/logout")
-    @require_auth
     def logout() -> Response:
-        response = redirect(url_for("index"))
-        response.headers["WWW-Authenticate"] = 'Basic realm="EchoTrace"'
-        return response
+        if expected_blob is None:
+            # Open deployments have no credentials to forget.
+            return cast(Response, redirect(url_for("index")))
+        # A bare 401 challenge makes browsers forget cached Basic credentials.
+        return _auth_required_response()
 
     return app
 
 
+@functools.lru_cache(maxsize=64)
+def _transcript_base(pack_name: str) -> Path:
+    return (Path("content-packs") / pack_name / "transcripts").resolve()
+
+
+def _json(payload: Any, status: int = 200) -> Response:
+    """Build a compact JSON response without going through Flask's stdlib encoder."""
+    return Response(json_codec.dumps(payload), status=status, mimetype="application/json")
+
+
+def _json_with_etag(payload: Any) -> Response:
+    """Serialise a polled payload, answering ``304`` when the client copy is current."""
+    body = json_codec.dumps(payload)
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+
+def _analytics_summary_payload(logs_dir: Path) -> dict[str, Any] | None:
+    summary = summarize_events(logs_dir)
+    if summary is None:
+        return None
+    return {
+        "ok": True,
+        "by_node": dict(summary.by_node),
+        "heartbeat_by_node": dict(summary.heartbeat_by_node),
+        "narrative_unlocks": summary.narrative_unlocks,
+        "total_triggers": summary.total_triggers,
+        "completion_rate": summary.completion_rate,
+        "mean_trigger_interval_seconds": summary.mean_trigger_interval_seconds,
+        "recent_events": [dict(event) for event in summary.recent_events],
+    }
+
+
+def _credentials_blob(username: str, password: str) -> bytes:
+    # Length-prefixing keeps ("ab", "c") and ("a", "bc") distinct in one comparison.
+    return f"{len(username)}:{username}\x00{password}".encode()
+
+
 def _auth_required_response() -> Response:
     response = Response(status=401)
     response.headers["WWW-Authenticate"] = 'Basic realm="EchoTrace"'
@@ -398,7 +558,17 @@ def _auth_required_response() -> Response:
 def _require_json(req: Request) -> dict[str, Any]:
     if not req.is_json:
         abort(400, description="Expected JSON body.")
-    data = req.get_json()
+    # Refuse oversized bodies from the declared length before reading them.
+    if req.content_length is not None and req.content_length > MAX_JSON_BYTES:
+        abort(413, description="JSON body is too large.")
+    # Chunked uploads carry no length, so never read more than one byte past the limit.
+    raw = req.stream.read(MAX_JSON_BYTES + 1)
+    if len(raw) > MAX_JSON_BYTES:
+        abort(413, description="JSON body is too large.")
+    try:
+        data = json_codec.loads(raw)
+    except ValueError:
+        abort(400, description="Malformed JSON body.")
     if not isinstance(data, dict):
         abort(400, description="JSON body must be an object.")
     return data
@@ -4,70 +4,134 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
+import functools
 import logging
+import os
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, TextIO
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, Optional, Tuple
 
 
 LOGGER = logging.getLogger(__name__)
 
 CSV_COLUMNS = ["timestamp", "event", "node_id", "detail"]
 
+# Matches csv.writer's default dialect so appended rows stay consistent with older files.
+_LINE_TERMINATOR = "\r\n"
+_CSV_HEADER_BYTES = (",".join(CSV_COLUMNS) + _LINE_TERMINATOR).encode()
+_RECENT_EVENT_LIMIT = 10
 
-class CsvEventLogger:
-    """Append EchoTrace events to a daily CSV file with automatic rotation."""
 
-    def __init__(self, logs_dir: Path) -> None:
+class CsvEventLogger:
+    """
+    Append EchoTrace events to a daily CSV file with automatic rotation.
+
+    Rows are buffered and flushed once ``batch_size`` events are pending or
+    ``flush_interval`` seconds have passed, whichever comes first; an idle
+    timer flushes stragglers so readers never lag by more than the interval.
+    """
+
+    def __init__(
+        self,
+        logs_dir: Path,
+        *,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+    ) -> None:
         self._logs_dir = logs_dir
         self._logs_dir.mkdir(parents=True, exist_ok=True)
         self._current_date: Optional[dt.date] = None
         self._file_path: Optional[Path] = None
-        self._file_obj: Optional[TextIO] = None
-        self._writer: Optional[csv.DictWriter] = None
+        # Raw O_APPEND descriptor; rows are encoded up front and written in batches.
+        self._fd: Optional[int] = None
+        self._buffer: List[bytes] = []
+        # Re-entrant because day rotation closes the file while a write holds the lock.
+        self._lock = threading.RLock()
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
 
     def record_event(self, event: str, node_id: Optional[str], detail: str) -> None:
         """Record a single event entry to the current CSV file."""
-        timestamp = dt.datetime.now(tz=dt.timezone.utc)
-        self._ensure_writer(timestamp.date())
-
-        if self._writer is None:
-            raise RuntimeError("CSV writer not initialised.")  # pragma: no cover
-
-        row = {
-            "timestamp": timestamp.isoformat(),
-            "event": event,
-            "node_id": node_id or "",
-            "detail": detail,
-        }
-
-        try:
-            self._writer.writerow(row)
-            if self._file_obj:
-                self._file_obj.flush()
-        except OSError as exc:
-            raise RuntimeError(f"Failed to write event log: {exc}") from exc
-
-    def close(self) -> None:
-        """Close the current file handle, if any."""
-        if self._file_obj:
+        now = time.time()
+        second = int(now)
+        stamp, day = _utc_second(second)
+        # Timestamps and event names never need quoting; node ids and details may.
+        line = (
+            f"{stamp}.{int((now - second) * 1_000_000):06d}+00:00,{event},"
+            f"{_csv_field(node_id or '')},{_csv_field(detail)}{_LINE_TERMINATOR}"
+        ).encode()
+
+        # Events arrive from the MQTT thread and concurrent config pushes.
+        with self._lock:
+            self._ensure_writer(day)
+            self._buffer.append(line)
             try:
-                self._file_obj.close()
+                if (
+                    len(self._buffer) >= self._batch_size
+                    or time.monotonic() - self._last_flush >= self._flush_interval
+                ):
+                    self._flush_locked()
+                elif self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            except OSError as exc:
+                raise RuntimeError(f"Failed to write event log: {exc}") from exc
+
+    def flush(self) -> None:
+        """Write any buffered rows through to the CSV file."""
+        with self._lock:
+            try:
+                self._flush_locked()
             except OSError:
-                LOGGER.debug("Failed to close event log file cleanly.", exc_info=True)
-        self._file_obj = None
-        self._writer = None
-        self._current_date = None
+                LOGGER.warning("Failed to flush event log.", exc_info=True)
+
+    def close(self) -> None:
+        """Flush buffered rows and close the current file handle, if any."""
+        with self._lock:
+            self.flush()
+            if self._fd is not None:
+                try:
+                    os.close(self._fd)
+                except OSError:
+                    LOGGER.debug("Failed to close event log file cleanly.", exc_info=True)
+            self._fd = None
+            self._buffer.clear()
+            self._current_date = None
 
     def latest_csv(self) -> Optional[Path]:
         """Return the most recent CSV file in the logs directory."""
-        candidates = sorted(self._logs_dir.glob("*_events.csv"))
-        if not candidates:
-            return None
-        return candidates[-1]
+        with self._lock:
+            # The open daily file is the newest one; skip the directory scan while writing.
+            if self._fd is not None and self._file_path is not None:
+                return self._file_path
+        return latest_event_csv(self._logs_dir)
+
+    def _flush_locked(self) -> None:
+        self._cancel_flush_timer()
+        self._last_flush = time.monotonic()
+        if self._fd is None or not self._buffer:
+            return
+        data = memoryview(b"".join(self._buffer))
+        self._buffer.clear()
+        # One append per batch; loop only in case the kernel accepts a partial write.
+        while data:
+            written = os.write(self._fd, data)
+            data = data[written:]
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
 
     def _ensure_writer(self, current_date: dt.date) -> None:
-        if self._current_date == current_date and self._writer is not None:
+        if self._current_date == current_date and self._fd is not None:
             return
         self.close()
 
@@ -76,11 +140,9 @@ class CsvEventLogger:
 
         try:
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_exists = file_path.exists()
-            self._file_obj = file_path.open("a", encoding="utf-8", newline="")
-            self._writer = csv.DictWriter(self._file_obj, fieldnames=CSV_COLUMNS)
-            if not file_exists:
-                self._writer.writeheader()
+            self._fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            if os.fstat(self._fd).st_size == 0:
+                os.write(self._fd, _CSV_HEADER_BYTES)
         except OSError as exc:
             raise RuntimeError(f"Unable to open log file {file_path}: {exc}") from exc
 
@@ -97,83 +159,147 @@ class CsvEventLogger:
             )
 
 
-@dataclass
+@functools.lru_cache(maxsize=2)
+def _utc_second(second: int) -> Tuple[str, dt.date]:
+    """Format a whole UTC second once; bursts of events share the result."""
+    parts = time.gmtime(second)
+    return (
+        time.strftime("%Y-%m-%dT%H:%M:%S", parts),
+        dt.date(parts.tm_year, parts.tm_mon, parts.tm_mday),
+    )
+
+
+def _csv_field(value: str) -> str:
+    """Quote a field the way csv.QUOTE_MINIMAL would."""
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if "," in value or "\n" in value or "\r" in value:
+        return '"' + value + '"'
+    return value
+
+
+@dataclass(frozen=True)
 class AnalyticsSummary:
-    """Aggregate interpretation-ready analytics metrics."""
+    """
+    Aggregate interpretation-ready analytics metrics.
+
+    Summaries are shared between callers while the log is unchanged, so the
+    mappings are read-only views and ``recent_events`` is a tuple.
+    """
 
-    by_node: Dict[str, int]
-    heartbeat_by_node: Dict[str, int]
+    by_node: Mapping[str, int]
+    heartbeat_by_node: Mapping[str, int]
     narrative_unlocks: int
     total_triggers: int
     completion_rate: float
     mean_trigger_interval_seconds: float
-    recent_events: List[Dict[str, str]]
+    recent_events: Tuple[Mapping[str, str], ...]
+
+
+def latest_event_csv(logs_dir: Path) -> Optional[Path]:
+    """Return the most recent daily CSV in ``logs_dir`` without opening a logger."""
+    # ISO-dated filenames sort chronologically.
+    return max(logs_dir.glob("*_events.csv"), default=None)
+
+
+_SUMMARY_CACHE: Dict[Path, Tuple[Tuple[Path, int, int], AnalyticsSummary]] = {}
 
 
 def summarize_events(logs_dir: Path) -> Optional[AnalyticsSummary]:
-    """Parse the latest CSV log and return derived metrics."""
-    logger = CsvEventLogger(logs_dir)
-    latest = logger.latest_csv()
-    logger.close()
-    if latest is None or not latest.exists():
+    """
+    Parse the latest CSV log and return derived metrics.
+
+    Summaries are reused until the newest log's mtime or size changes, so
+    repeated calls between appends do not re-read the file.
+    """
+    latest = latest_event_csv(logs_dir)
+    if latest is None:
+        return None
+    try:
+        stat = latest.stat()
+    except OSError:
+        return None
+    signature = (latest, stat.st_mtime_ns, stat.st_size)
+    cached = _SUMMARY_CACHE.get(logs_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    summary = _summarize_csv(latest)
+    if summary is None:
+        _SUMMARY_CACHE.pop(logs_dir, None)
         return None
+    _SUMMARY_CACHE[logs_dir] = (signature, summary)
+    return summary
 
+
+def _summarize_csv(latest: Path) -> Optional[AnalyticsSummary]:
     by_node: Dict[str, int] = {}
     heartbeat_by_node: Dict[str, int] = {}
     narrative_unlocks = 0
-    trigger_timestamps: List[dt.datetime] = []
-    recent_events: List[Dict[str, str]] = []
+    trigger_count = 0
+    first_trigger: Optional[dt.datetime] = None
+    last_trigger: Optional[dt.datetime] = None
+    recent_rows: Deque[List[str]] = deque(maxlen=_RECENT_EVENT_LIMIT)
 
     try:
-        with latest.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            rows = list(reader)
+        with latest.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(handle)
+            header = next(reader, None) or CSV_COLUMNS
+            # Columns absent from the header read from a padding slot that is always "".
+            width = len(header)
+            columns = [header.index(name) if name in header else width for name in CSV_COLUMNS]
+            ts_col, event_col, node_col, _detail_col = columns
+            for row in reader:
+                if not row:
+                    continue  # DictReader skipped blank lines; keep them out of recent events
+                if len(row) <= width:
+                    row.extend([""] * (width + 1 - len(row)))
+                recent_rows.append(row)
+                event = row[event_col]
+                if event == "fragment_triggered":
+                    node_id = row[node_col]
+                    by_node[node_id] = by_node.get(node_id, 0) + 1
+                    timestamp_raw = row[ts_col]
+                    if timestamp_raw:
+                        try:
+                            stamp = dt.datetime.fromisoformat(timestamp_raw)
+                        except ValueError:
+                            continue
+                        trigger_count += 1
+                        if first_trigger is None or stamp < first_trigger:
+                            first_trigger = stamp
+                        if last_trigger is None or stamp > last_trigger:
+                            last_trigger = stamp
+                elif event == "heartbeat_received":
+                    node_id = row[node_col]
+                    heartbeat_by_node[node_id] = heartbeat_by_node.get(node_id, 0) + 1
+                elif event == "narrative_unlocked":
+                    narrative_unlocks += 1
     except OSError as exc:
         LOGGER.warning("Unable to read analytics log %s: %s", latest, exc)
         return None
 
-    for row in rows:
-        event = row.get("event", "")
-        node_id = row.get("node_id", "") or ""
-        detail = row.get("detail", "")
-        timestamp_raw = row.get("timestamp", "")
-
-        recent_events.append(
-            {"timestamp": timestamp_raw, "event": event, "node_id": node_id, "detail": detail}
-        )
-
-        if event == "fragment_triggered":
-            by_node[node_id] = by_node.get(node_id, 0) + 1
-            if timestamp_raw:
-                try:
-                    trigger_timestamps.append(dt.datetime.fromisoformat(timestamp_raw))
-                except ValueError:
-                    pass
-        elif event == "heartbeat_received":
-            heartbeat_by_node[node_id] = heartbeat_by_node.get(node_id, 0) + 1
-        elif event == "narrative_unlocked":
-            narrative_unlocks += 1
-
     total_triggers = sum(by_node.values())
     completion_rate = 0.0
     if total_triggers > 0:
         completion_rate = min(1.0, narrative_unlocks / total_triggers)
 
+    # The gaps between sorted trigger times telescope, so their mean is the overall
+    # span divided by the number of gaps; no sort or per-gap list is needed.
     mean_interval = 0.0
-    if len(trigger_timestamps) >= 2:
-        trigger_timestamps.sort()
-        deltas = [
-            (trigger_timestamps[i] - trigger_timestamps[i - 1]).total_seconds()
-            for i in range(1, len(trigger_timestamps))
-        ]
-        if deltas:
-            mean_interval = sum(deltas) / len(deltas)
+    if trigger_count >= 2 and first_trigger is not None and last_trigger is not None:
+        mean_interval = (last_trigger - first_trigger).total_seconds() / (trigger_count - 1)
 
-    recent_events = recent_events[-10:]
+    recent_events = tuple(
+        MappingProxyType(
+            {name: row[column] for name, column in zip(CSV_COLUMNS, columns, strict=True)}
+        )
+        for row in recent_rows
+    )
 
     return AnalyticsSummary(
-        by_node=by_node,
-        heartbeat_by_node=heartbeat_by_node,
+        by_node=MappingProxyType(by_node),
+        heartbeat_by_node=MappingProxyType(heartbeat_by_node),
         narrative_unlocks=narrative_unlocks,
         total_triggers=total_triggers,
         completion_rate=completion_rate,
@@ -182,4 +308,10 @@ def summarize_events(logs_dir: Path) -> Optional[AnalyticsSummary]:
     )
 
 
-__all__ = ["AnalyticsSummary", "CSV_COLUMNS", "CsvEventLogger", "summarize_events"]
+__all__ = [
+    "AnalyticsSummary",
+    "CSV_COLUMNS",
+    "CsvEventLogger",
+    "latest_event_csv",
+    "summarize_events",
+]
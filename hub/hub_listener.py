@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 try:  # pragma: no cover - executed when paho-mqtt is installed
     import paho.mqtt.client as mqtt
 except ImportError:  # pragma: no cover - executed in environments without paho-mqtt
     mqtt = None  # type: ignore[assignment]
 
+from . import json_codec
 from .config_loader import HubConfig, load_config
 from .event_logging import CsvEventLogger
 from .mqtt_topics import (
@@ -24,6 +25,7 @@ from .mqtt_topics import (
     hub_state_topic,
     node_ack_topic,
     node_config_topic,
+    trigger_topic,
     trigger_wildcard,
 )
 from .narrative_state import NarrativeState
@@ -31,7 +33,7 @@ from .narrative_state import NarrativeState
 LOGGER = logging.getLogger(__name__)
 
 _HEALTH_PREFIX = health_topic("")
-_TRIGGER_PREFIX = f"{trigger_wildcard().rsplit('/', 1)[0]}/"
+_TRIGGER_PREFIX = trigger_topic("")
 _ACK_PREFIX = node_ack_topic("")
 
 
@@ -39,19 +41,16 @@ _ACK_PREFIX = node_ack_topic("")
 class HubRuntimeState:
     """In-memory snapshot of hub observability data."""
 
-    last_seen: Dict[str, datetime] = field(default_factory=dict)
+    last_seen: Dict[str, float] = field(default_factory=dict)
 
-    def update_health(self, node_id: str, timestamp: datetime) -> None:
-        """Record the last time a heartbeat was observed for a node."""
+    def update_health(self, node_id: str, timestamp: float) -> None:
+        """Record the epoch time at which a heartbeat was observed for a node."""
         self.last_seen[node_id] = timestamp
 
     def snapshot(self) -> Dict[str, float]:
         """Return seconds elapsed since the last heartbeat per node."""
-        now = datetime.now(tz=timezone.utc)
-        return {
-            node_id: (now - seen).total_seconds()
-            for node_id, seen in self.last_seen.items()
-        }
+        now = time.time()
+        return {node_id: now - seen for node_id, seen in self.last_seen.items()}
 
 
 class HubListener:
@@ -76,8 +75,17 @@ class HubListener:
         )
         self._event_logger = CsvEventLogger(self._config.logs_dir)
 
-        self._ack_events: Dict[str, threading.Event] = {}
-        self._ack_lock = threading.Lock()
+        # Pending acknowledgements are only ever set, read, or popped one key at a
+        # time. Each of those is a single atomic dict operation under CPython's GIL,
+        # so pushing threads and the MQTT callback thread share the dict lock-free.
+        self._ack_events: Dict[str, Future[bytes]] = {}
+        self._published_state: Optional[bytes] = None
+        self._stop_requested = threading.Event()
+        self._handlers: Dict[str, Callable[[str, bytes], None]] = {
+            _HEALTH_PREFIX: self._handle_health,
+            _TRIGGER_PREFIX: self._handle_trigger,
+            _ACK_PREFIX: self._handle_ack,
+        }
 
     def start(self) -> None:
         """Connect to the MQTT broker and begin processing messages."""
@@ -91,6 +99,7 @@ class HubListener:
 
     def stop(self) -> None:
         """Stop the MQTT listener and close resources."""
+        self._stop_requested.set()
         self._client.loop_stop()
         self._client.disconnect()
         self._event_logger.close()
@@ -99,8 +108,8 @@ class HubListener:
         """Run the listener until interrupted."""
         self.start()
         try:
-            while True:
-                time.sleep(1)
+            # Block without periodic wakeups; Ctrl+C still interrupts the wait.
+            self._stop_requested.wait()
         except KeyboardInterrupt:  # pragma: no cover - manual stop
             LOGGER.info("Hub listener interrupted by user.")
             raise
@@ -117,28 +126,33 @@ class HubListener:
         if not isinstance(payload, dict):
             raise ValueError("Node configuration payload must be a dictionary.")
 
-        message = json.dumps(payload)
-        ack_event = threading.Event()
-        with self._ack_lock:
-            self._ack_events[node_id] = ack_event
+        encoded = json_codec.dumps(payload)
+        message = encoded.decode("utf-8")
+        ack: Future[bytes] = Future()
+        self._ack_events[node_id] = ack
 
-        info = self._client.publish(node_config_topic(node_id), message, qos=1)
+        info = self._client.publish(node_config_topic(node_id), encoded, qos=1)
         if info.rc != mqtt.MQTT_ERR_SUCCESS:  # type: ignore[attr-defined]
             LOGGER.error("Failed to publish configuration to %s: rc=%s", node_id, info.rc)
-            with self._ack_lock:
-                self._ack_events.pop(node_id, None)
+            self._discard_ack(node_id, ack)
             return False
 
         LOGGER.info("Pushed configuration to %s, awaiting acknowledgement.", node_id)
-        if ack_event.wait(timeout):
-            self._event_logger.record_event("config_push_ok", node_id, message)
-            return True
+        try:
+            ack.result(timeout)
+        except FutureTimeoutError:
+            LOGGER.warning("Configuration push to %s timed out after %.1fs.", node_id, timeout)
+            self._event_logger.record_event("config_push_timeout", node_id, message)
+            self._discard_ack(node_id, ack)
+            return False
 
-        LOGGER.warning("Configuration push to %s timed out after %.1fs.", node_id, timeout)
-        self._event_logger.record_event("config_push_timeout", node_id, message)
-        with self._ack_lock:
+        self._event_logger.record_event("config_push_ok", node_id, message)
+        return True
+
+    def _discard_ack(self, node_id: str, ack: Future[bytes]) -> None:
+        # Leave a newer push to the same node waiting on its own future.
+        if self._ack_events.get(node_id) is ack:
             self._ack_events.pop(node_id, None)
-        return False
 
     def reset_state(self) -> None:
         """Clear the narrative state and retain heartbeat history."""
@@ -156,11 +170,16 @@ class HubListener:
 
     def publish_state(self) -> None:
         """Publish the narrative state to the MQTT broker."""
-        payload = json.dumps(self._narrative.snapshot())
+        payload = self._narrative.payload_bytes()
+        if payload is self._published_state:
+            # The broker already retains this exact state; duplicate triggers land here.
+            LOGGER.debug("Hub state unchanged; skipping publish.")
+            return
         info = self._client.publish(hub_state_topic(), payload, qos=1, retain=True)
         if info.rc != mqtt.MQTT_ERR_SUCCESS:  # type: ignore[attr-defined]
             LOGGER.error("Failed to publish hub state: rc=%s", info.rc)
         else:
+            self._published_state = payload
             LOGGER.debug("Published hub state: %s", payload)
 
     # MQTT callbacks -----------------------------------------------------
@@ -187,43 +206,43 @@ class HubListener:
         message: mqtt.MQTTMessage,
     ) -> None:
         topic = message.topic or ""
-        payload = message.payload.decode("utf-8") if message.payload else ""
-        if topic.startswith(_HEALTH_PREFIX):
-            node_id = topic[len(_HEALTH_PREFIX) :]
-            self._handle_health(node_id, payload)
-        elif topic.startswith(_TRIGGER_PREFIX):
-            node_id = topic[len(_TRIGGER_PREFIX) :]
-            self._handle_trigger(node_id, payload)
-        elif topic.startswith(_ACK_PREFIX):
-            node_id = topic[len(_ACK_PREFIX) :]
-            self._handle_ack(node_id, payload)
-        else:
+        # Subscriptions use single-level wildcards, so the node id is the last topic level.
+        split_at = topic.rfind("/") + 1
+        handler = self._handlers.get(topic[:split_at])
+        if handler is None:
             LOGGER.debug("Ignoring message on unhandled topic: %s", topic)
+            return
+        # Handlers parse the raw bytes and only decode what they log.
+        handler(topic[split_at:], bytes(message.payload or b""))
 
-    def _handle_health(self, node_id: str, payload: str) -> None:
-        timestamp = datetime.now(tz=timezone.utc)
+    def _handle_health(self, node_id: str, payload: bytes) -> None:
+        timestamp = time.time()
         try:
-            data = json.loads(payload) if payload else {}
+            data = json_codec.loads(payload) if payload else {}
             epoch = data.get("ts")
             if isinstance(epoch, (int, float)):
-                timestamp = datetime.fromtimestamp(epoch, tz=timezone.utc)
-        except json.JSONDecodeError:
-            LOGGER.warning("Invalid health payload from %s: %s", node_id, payload)
+                timestamp = float(epoch)
+        except ValueError:
+            LOGGER.warning("Invalid health payload from %s: %r", node_id, payload)
             self._event_logger.record_event("heartbeat_received", node_id, "invalid_json")
             return
 
         self._runtime.update_health(node_id, timestamp)
-        self._event_logger.record_event("heartbeat_received", node_id, payload or "{}")
+        detail = payload.decode("utf-8") if payload else "{}"
+        self._event_logger.record_event("heartbeat_received", node_id, detail)
 
-    def _handle_trigger(self, node_id: str, payload: str) -> None:
+    def _handle_trigger(self, node_id: str, payload: bytes) -> None:
         try:
-            data = json.loads(payload) if payload else {}
-        except json.JSONDecodeError:
-            LOGGER.warning("Invalid trigger payload from %s: %s", node_id, payload)
+            if payload:
+                json_codec.loads(payload)
+        except ValueError:
+            LOGGER.warning("Invalid trigger payload from %s: %r", node_id, payload)
             self._event_logger.record_event("fragment_triggered", node_id, "invalid_json")
             return
 
-        self._event_logger.record_event("fragment_triggered", node_id, json.dumps(data))
+        # The payload is known-valid JSON, so log it verbatim rather than re-encoding it.
+        detail = payload.decode("utf-8") if payload else "{}"
+        self._event_logger.record_event("fragment_triggered", node_id, detail)
 
         unlocked_before = self._narrative.unlocked
         is_new = self._narrative.register_trigger(node_id)
@@ -240,12 +259,12 @@ class HubListener:
             )
             LOGGER.info("Narrative unlocked after trigger from %s.", node_id)
 
-    def _handle_ack(self, node_id: str, payload: str) -> None:
-        self._event_logger.record_event("config_ack", node_id, payload or "{}")
-        with self._ack_lock:
-            event = self._ack_events.pop(node_id, None)
-        if event:
-            event.set()
+    def _handle_ack(self, node_id: str, payload: bytes) -> None:
+        detail = payload.decode("utf-8", errors="replace") if payload else "{}"
+        self._event_logger.record_event("config_ack", node_id, detail)
+        ack = self._ack_events.pop(node_id, None)
+        if ack is not None:
+            ack.set_result(payload)
         else:
             LOGGER.warning("Received unexpected ACK from %s.", node_id)
 
@@ -0,0 +1,34 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - executed when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover - executed in environments without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialise a value to compact UTF-8 JSON bytes.
+
+    Non-string dict keys (ints, bools, ``None`` from YAML documents) are
+    stringified as the stdlib encoder does. Other unsupported values raise
+    ``TypeError`` regardless of the backend in use.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text; malformed input raises ``ValueError``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
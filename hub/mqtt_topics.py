@@ -2,28 +2,35 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 from typing import Final
 
 
-_PREFIX: Final[str] = "ECHOTRACE"
-_HEALTH_TEMPLATE: Final[str] = f"{_PREFIX}/health/{{node_id}}"
-_TRIGGER_TEMPLATE: Final[str] = f"{_PREFIX}/trigger/{{node_id}}"
-_STATE_HUB: Final[str] = f"{_PREFIX}/state/hub"
-_CONFIG_TEMPLATE: Final[str] = f"{_PREFIX}/config/{{node_id}}"
-_ACK_TEMPLATE: Final[str] = f"{_PREFIX}/ack/{{node_id}}"
+_PREFIX: Final[str] = sys.intern("ECHOTRACE")
+# Per-node topics are a fixed prefix plus the node id, so they are built by concatenation.
+_HEALTH_PREFIX: Final[str] = sys.intern(f"{_PREFIX}/health/")
+_TRIGGER_PREFIX: Final[str] = sys.intern(f"{_PREFIX}/trigger/")
+_STATE_HUB: Final[str] = sys.intern(f"{_PREFIX}/state/hub")
+_CONFIG_PREFIX: Final[str] = sys.intern(f"{_PREFIX}/config/")
+_ACK_PREFIX: Final[str] = sys.intern(f"{_PREFIX}/ack/")
 _HEALTH_WILDCARD: Final[str] = f"{_PREFIX}/health/+"
 _TRIGGER_WILDCARD: Final[str] = f"{_PREFIX}/trigger/+"
 _ACK_WILDCARD: Final[str] = f"{_PREFIX}/ack/+"
+# Node ids form a small, stable set, so per-node topics are built once and reused.
+_TOPIC_CACHE_SIZE: Final[int] = 4096
 
 
+@functools.lru_cache(maxsize=_TOPIC_CACHE_SIZE)
 def health_topic(node_id: str) -> str:
     """Return the health topic for a given node identifier."""
-    return _HEALTH_TEMPLATE.format(node_id=node_id)
+    return _HEALTH_PREFIX + node_id
 
 
+@functools.lru_cache(maxsize=_TOPIC_CACHE_SIZE)
 def trigger_topic(node_id: str) -> str:
     """Return the trigger topic for a given node identifier."""
-    return _TRIGGER_TEMPLATE.format(node_id=node_id)
+    return _TRIGGER_PREFIX + node_id
 
 
 def hub_state_topic() -> str:
@@ -31,14 +38,16 @@ def hub_state_topic() -> str:
     return _STATE_HUB
 
 
+@functools.lru_cache(maxsize=_TOPIC_CACHE_SIZE)
 def node_config_topic(node_id: str) -> str:
     """Return the configuration topic for a specific node."""
-    return _CONFIG_TEMPLATE.format(node_id=node_id)
+    return _CONFIG_PREFIX + node_id
 
 
+@functools.lru_cache(maxsize=_TOPIC_CACHE_SIZE)
 def node_ack_topic(node_id: str) -> str:
     """Return the acknowledgement topic for a specific node."""
-    return _ACK_TEMPLATE.format(node_id=node_id)
+    return _ACK_PREFIX + node_id
 
 
 def health_wildcard() -> str:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
+
+from . import json_codec
 
 
 @dataclass
@@ -13,6 +15,11 @@ class NarrativeState:
     required_fragments: int
     triggered_whispers: Set[str] = field(default_factory=set)
     unlocked: bool = False
+    # Snapshot of the current state, rebuilt only after a new trigger or reset.
+    _snapshot: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _payload: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     def register_trigger(self, node_id: str) -> bool:
         """
@@ -25,23 +32,42 @@ class NarrativeState:
         self.triggered_whispers.add(node_id)
         if not self.unlocked and len(self.triggered_whispers) >= self.required_fragments:
             self.unlocked = True
+        self._invalidate()
         return True
 
     def reset(self) -> None:
         """Clear tracked triggers and reset unlock status."""
         self.triggered_whispers.clear()
         self.unlocked = False
+        self._invalidate()
 
     def snapshot(self) -> Dict[str, object]:
         """Return a serialisable view of the current narrative state."""
-        return {
-            "unlocked": self.unlocked,
-            "triggered": self.triggered_list(),
-        }
+        cached = self._cached_snapshot()
+        # Callers may mutate what they get back, so hand out copies of the cache.
+        return {"unlocked": cached["unlocked"], "triggered": list(cached["triggered"])}
+
+    def payload_bytes(self) -> bytes:
+        """Return the snapshot as JSON bytes, re-encoding only after the state changes."""
+        if self._payload is None:
+            self._payload = json_codec.dumps(self._cached_snapshot())
+        return self._payload
 
     def triggered_list(self) -> List[str]:
         """Expose the triggered whisper identifiers sorted for readability."""
-        return sorted(self.triggered_whispers)
+        return list(self._cached_snapshot()["triggered"])
+
+    def _cached_snapshot(self) -> Dict[str, Any]:
+        if self._snapshot is None:
+            self._snapshot = {
+                "unlocked": self.unlocked,
+                "triggered": sorted(self.triggered_whispers),
+            }
+        return self._snapshot
+
+    def _invalidate(self) -> None:
+        self._snapshot = None
+        self._payload = None
 
 
 __all__ = ["NarrativeState"]
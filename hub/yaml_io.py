@@ -0,0 +1,121 @@
+"""YAML loading helpers shared by the hub configuration modules."""
+
+from __future__ import annotations
+
+import logging
+import os
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+import yaml  # type: ignore[import]
+
+from . import json_codec
+
+LOGGER = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def sidecar_path(path: Path) -> Path:
+    """Return the JSON sidecar location used to cache a parsed YAML file."""
+    return path.with_suffix(path.suffix + ".json")
+
+
+def load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML document, preferring a fresh JSON sidecar when one exists.
+
+    The sidecar records the mtime and size of the YAML it was built from and is
+    only trusted while both still match, so subsequent boots skip the YAML
+    scanner entirely. Parse errors surface as ``yaml.YAMLError``.
+    """
+    sidecar = sidecar_path(path)
+    stat = path.stat()
+    source = [stat.st_mtime_ns, stat.st_size]
+    try:
+        cached = json_codec.loads(sidecar.read_bytes())
+        if isinstance(cached, dict) and cached.get("source") == source:
+            return cached.get("data")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        LOGGER.debug("Ignoring unreadable YAML sidecar %s", sidecar, exc_info=True)
+
+    with path.open("r", encoding="utf-8") as handle:
+        data = yaml.load(handle, Loader=YAML_LOADER)  # noqa: S506
+    _write_sidecar(sidecar, source, data)
+    return data
+
+
+def dump_yaml(path: Path, data: Any) -> None:
+    """
+    Write ``data`` to ``path`` as YAML and refresh its sidecar.
+
+    The document is written to a temporary file and swapped into place, so
+    concurrent readers see either the old or the new file, never a partial one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    discard_sidecar(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8") as handle:
+            yaml.dump(data, handle, Dumper=YAML_DUMPER, sort_keys=True)
+        os.replace(temp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            temp_path.unlink()
+        raise
+    store_sidecar(path, data)
+
+
+def store_sidecar(path: Path, data: Any) -> None:
+    """Write the JSON sidecar for ``path`` from data just saved to that YAML file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        discard_sidecar(path)
+        return
+    _write_sidecar(sidecar_path(path), [stat.st_mtime_ns, stat.st_size], data)
+
+
+def discard_sidecar(path: Path) -> None:
+    """Remove the JSON sidecar for a YAML file that is being rewritten."""
+    try:
+        sidecar_path(path).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError:
+        LOGGER.debug("Unable to remove YAML sidecar for %s", path, exc_info=True)
+
+
+def _write_sidecar(sidecar: Path, source: list[int], data: Any) -> None:
+    try:
+        encoded = json_codec.dumps({"source": source, "data": data})
+    except (TypeError, ValueError):
+        LOGGER.debug("YAML document %s is not JSON-serialisable; no sidecar written.", sidecar)
+        return
+    # JSON may stringify non-string keys, so only cache lossless documents.
+    if json_codec.loads(encoded)["data"] != data:
+        return
+    temp_path = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(encoded)
+        os.replace(temp_path, sidecar)
+    except OSError:
+        LOGGER.debug("Unable to write YAML sidecar %s", sidecar, exc_info=True)
+        with suppress(OSError):
+            temp_path.unlink()
+
+
+__all__ = [
+    "YAML_DUMPER",
+    "YAML_LOADER",
+    "discard_sidecar",
+    "dump_yaml",
+    "load_yaml",
+    "sidecar_path",
+    "store_sidecar",
+]
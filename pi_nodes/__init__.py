@@ -7,4 +7,5 @@ __all__ = [
     "haptics",
     "node_service",
     "mqtt_topics",
+    "json_codec",
 ]
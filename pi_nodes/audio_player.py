@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 try:  # pragma: no cover - executed when pygame is available
     from pygame import mixer
@@ -14,25 +14,51 @@ except ImportError:  # pragma: no cover - executed in test/mock environments
 
 LOGGER = logging.getLogger(__name__)
 
+# SDL's defaults buffer several thousand samples; a short buffer keeps trigger-to-sound
+# latency near 5 ms. Installations that hear dropouts can raise it to 512 or 1024.
+DEFAULT_SAMPLE_RATE = 48000
+DEFAULT_BUFFER_SAMPLES = 256
+
 
 class AudioPlayer:
     """Provide a thin wrapper around pygame.mixer with safety limiting."""
 
-    def __init__(self) -> None:
+    __slots__ = ("_loaded_path", "_loaded_str", "_mixer_source", "_music", "_safety_limit")
+
+    def __init__(self, buffer_samples: int = DEFAULT_BUFFER_SAMPLES) -> None:
         self._loaded_path: Optional[Path] = None
+        self._loaded_str: Optional[str] = None
+        # Path string currently decoded by mixer.music, so play() can start immediately.
+        self._mixer_source: Optional[str] = None
         self._safety_limit: float = 1.0
-        self._mixer_available = mixer is not None
-        if self._mixer_available and not mixer.get_init():  # type: ignore[union-attr]
+        # pygame.mixer.music resolved once; None whenever playback is unavailable.
+        self._music: Any = None
+        mixer_available = mixer is not None
+        if mixer_available and not mixer.get_init():  # type: ignore[union-attr]
             try:
-                mixer.init()  # type: ignore[union-attr]
-                LOGGER.info("pygame.mixer initialised for audio playback.")
+                mixer.init(  # type: ignore[union-attr]
+                    frequency=DEFAULT_SAMPLE_RATE,
+                    size=-16,
+                    channels=2,
+                    buffer=buffer_samples,
+                )
+                LOGGER.info(
+                    "pygame.mixer initialised for audio playback (%s, buffer=%s).",
+                    mixer.get_init(),  # type: ignore[union-attr]
+                    buffer_samples,
+                )
             except Exception as exc:  # pragma: no cover
                 LOGGER.warning("Failed to initialise pygame.mixer: %s", exc)
-                self._mixer_available = False
+                mixer_available = False
+        if mixer_available:
+            self._music = mixer.music  # type: ignore[union-attr]
 
     def load(self, path: Path) -> None:
-        """Store the path to the audio file to be played later."""
+        """Prepare an audio file for playback, opening it in the mixer ahead of play()."""
         self._loaded_path = path
+        self._loaded_str = str(path)
+        if self._music is not None and self._mixer_source != self._loaded_str:
+            self._load_into_mixer()
         LOGGER.debug("Audio fragment ready: %s", path)
 
     def set_safety_limit(self, limit: float) -> None:
@@ -43,11 +69,13 @@ class AudioPlayer:
         """Adjust output volume if the mixer is present, respecting the safety limit."""
         requested = max(0.0, min(1.0, value_0_to_1))
         effective = min(requested, self._safety_limit)
-        if not self._mixer_available or mixer is None:
+        music = self._music
+        if music is None:
             LOGGER.debug("Volume request %.2f ignored; mixer unavailable.", effective)
             return
-        mixer.music.set_volume(effective)  # type: ignore[union-attr]
-        LOGGER.debug("Volume set to %.2f (requested %.2f).", effective, requested)
+        music.set_volume(effective)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Volume set to %.2f (requested %.2f).", effective, requested)
 
     def play(self, loop: bool = False, pace: float = 1.0, repeat: int = 0) -> None:
         """
@@ -58,28 +86,43 @@ class AudioPlayer:
         if self._loaded_path is None:
             LOGGER.warning("No audio loaded; play() ignored.")
             return
-        if not self._mixer_available or mixer is None:
+        music = self._music
+        if music is None:
             LOGGER.info("Play request for %s ignored; mixer unavailable.", self._loaded_path)
             return
+        if self._mixer_source != self._loaded_str and not self._load_into_mixer():
+            return
         loops = repeat if repeat > 0 else (-1 if loop else 0)
         try:
-            mixer.music.load(str(self._loaded_path))  # type: ignore[union-attr]
-            mixer.music.play(loops)  # type: ignore[union-attr]
-            LOGGER.debug(
-                "Playback started for %s (loops=%s pace=%.2f).",
-                self._loaded_path,
-                loops,
-                pace,
-            )
+            music.play(loops)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "Playback started for %s (loops=%s pace=%.2f).",
+                    self._loaded_path,
+                    loops,
+                    pace,
+                )
         except Exception as exc:  # pragma: no cover
             LOGGER.error("Failed to play audio %s: %s", self._loaded_path, exc)
 
     def stop(self) -> None:
         """Stop playback when supported."""
-        if not self._mixer_available or mixer is None:
+        music = self._music
+        if music is None:
             LOGGER.debug("Stop request ignored; mixer unavailable.")
             return
-        mixer.music.stop()  # type: ignore[union-attr]
+        music.stop()
+
+    def _load_into_mixer(self) -> bool:
+        source = self._loaded_str
+        try:
+            self._music.load(source)
+        except Exception as exc:  # pragma: no cover
+            LOGGER.error("Failed to load audio %s: %s", source, exc)
+            self._mixer_source = None
+            return False
+        self._mixer_source = source
+        return True
 
 
 __all__ = ["AudioPlayer"]
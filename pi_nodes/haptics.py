@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
 try:  # pragma: no cover - executed when gpiozero is installed
@@ -12,8 +13,8 @@ except ImportError:  # pragma: no cover - executed in test/mock environments
 
 if TYPE_CHECKING:  # pragma: no cover - typing aid only
     from gpiozero import DigitalOutputDevice as DigitalOutputDeviceTyped  # type: ignore[import]
-else:
-
+elif DigitalOutputDevice is None:
+    # Only built when gpiozero is missing; hardware nodes never construct the stand-in.
     class DigitalOutputDeviceTyped:  # type: ignore[too-many-instance-attributes]
         """Fallback implementation used when gpiozero is not available."""
 
@@ -37,10 +38,15 @@ else:
 
 LOGGER = logging.getLogger(__name__)
 
+# Pulses this short are driven inline; gpiozero's blink() starts a thread per call.
+SYNC_PULSE_MAX_SECONDS = 0.05
+
 
 class Haptics:
     """Provide a minimal wrapper for toggling a vibration motor."""
 
+    __slots__ = ("_device",)
+
     def __init__(self, pin: int, active_high: bool = True) -> None:
         if DigitalOutputDevice is not None:
             self._device: DigitalOutputDeviceTyped = DigitalOutputDevice(pin, active_high=active_high)
@@ -51,8 +57,14 @@ class Haptics:
     def pulse(self, ms: int) -> None:
         """Emit a simple pulse of the requested duration."""
         seconds = max(0, ms) / 1000
-        self._device.blink(on_time=seconds, off_time=0.01, n=1)
-        LOGGER.debug("Haptic pulse triggered for %sms", ms)
+        if seconds < SYNC_PULSE_MAX_SECONDS:
+            self._device.on()
+            time.sleep(seconds)
+            self._device.off()
+        else:
+            self._device.blink(on_time=seconds, off_time=0.01, n=1)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Haptic pulse triggered for %sms", ms)
 
     def off(self) -> None:
         """Ensure the haptic driver is inactive."""
@@ -0,0 +1,37 @@
+"""
+Node-side JSON helpers; orjson is used when installed.
+
+Nodes are deployed without the hub package, so this mirrors ``hub.json_codec``
+the same way ``mqtt_topics`` mirrors the hub topic helpers. Keep the two in step.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - executed when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover - executed in environments without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialise a value to compact UTF-8 JSON bytes.
+
+    Non-string dict keys are stringified on both backends, matching ``json.dumps``.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text; malformed input raises ``ValueError``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import TYPE_CHECKING
+import os
+from typing import TYPE_CHECKING, Any, Optional
 
 try:  # pragma: no cover - executed when gpiozero is installed
     from gpiozero import PWMLED as PWMLED  # type: ignore[import]
 except ImportError:  # pragma: no cover - executed in test/mock environments
     PWMLED = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - executed when gpiozero's pigpio backend is installed
+    from gpiozero.pins.pigpio import PiGPIOFactory  # type: ignore[import]
+except ImportError:  # pragma: no cover - executed in test/mock environments
+    PiGPIOFactory = None  # type: ignore[assignment,misc]
+
 if TYPE_CHECKING:  # pragma: no cover - typing aid only
     from gpiozero import PWMLED as PWMLEDTyped  # type: ignore[import]
-else:
-
+elif PWMLED is None:
+    # Only built when gpiozero is missing; hardware nodes never construct the stand-in.
     class PWMLEDTyped:  # type: ignore[too-many-instance-attributes]
         """Very small fallback implementation for environments without gpiozero."""
 
@@ -41,9 +48,15 @@ LOGGER = logging.getLogger(__name__)
 class LedFeedback:
     """Simple wrapper around PWMLED supporting glow, blink, and off states."""
 
+    __slots__ = ("_led",)
+
     def __init__(self, pin: int, frequency: int = 100) -> None:
         if PWMLED is not None:
-            self._led: PWMLEDTyped = PWMLED(pin, frequency=frequency)
+            factory = _pwm_pin_factory()
+            if factory is not None:
+                self._led: PWMLEDTyped = PWMLED(pin, frequency=frequency, pin_factory=factory)
+            else:
+                self._led = PWMLED(pin, frequency=frequency)
         else:
             self._led = PWMLEDTyped(pin, frequency=frequency)
         LOGGER.debug("LedFeedback initialised on pin %s", pin)
@@ -52,7 +65,9 @@ class LedFeedback:
         """Set LED brightness to a value between 0 and 1."""
         clamped = max(0.0, min(1.0, level))
         self._led.value = clamped
-        LOGGER.debug("LED glow level set to %.2f", clamped)
+        # glow() runs on every sensor poll, so skip the logging call entirely unless needed.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("LED glow level set to %.2f", clamped)
 
     def blink(self, on_s: float, off_s: float) -> None:
         """Trigger a simple blink pattern."""
@@ -69,4 +84,22 @@ class LedFeedback:
         self._led.close()
 
 
+@functools.lru_cache(maxsize=1)
+def _pwm_pin_factory() -> Optional[Any]:
+    """
+    Return a pigpio pin factory when the pigpio daemon is reachable.
+
+    pigpio drives PWM from DMA rather than gpiozero's default software-PWM thread, so
+    glow levels stay steady without burning CPU. An explicit GPIOZERO_PIN_FACTORY
+    setting is left to gpiozero.
+    """
+    if PiGPIOFactory is None or os.environ.get("GPIOZERO_PIN_FACTORY"):
+        return None
+    try:
+        return PiGPIOFactory()
+    except Exception as exc:  # pragma: no cover - depends on the pigpio daemon
+        LOGGER.info("pigpio unavailable (%s); using gpiozero's default PWM.", exc)
+        return None
+
+
 __all__ = ["LedFeedback"]
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+# Formats and writes records on a background thread so audio/haptic paths only enqueue.
+_LISTENER: Optional[QueueListener] = None
 
 
 def configure_node_logging(log_file: Path = Path("node.log")) -> None:
     """Configure logging to emit to stdout and to a rotating log file."""
+    global _LISTENER
+
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
     root = logging.getLogger()
@@ -30,8 +38,21 @@ def configure_node_logging(log_file: Path = Path("node.log")) -> None:
     file_handler.setLevel(logging.ERROR)
     file_handler.setFormatter(_default_formatter())
 
-    root.addHandler(stream_handler)
-    root.addHandler(file_handler)
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _LISTENER = QueueListener(records, stream_handler, file_handler, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(_stop_listener)
+
+    root.addHandler(QueueHandler(records))
+
+
+def _stop_listener() -> None:
+    """Drain queued records and stop the background writer, if one is running."""
+    global _LISTENER
+
+    listener, _LISTENER = _LISTENER, None
+    if listener is not None:
+        listener.stop()
 
 
 def _default_formatter() -> logging.Formatter:
@@ -2,25 +2,49 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from dataclasses import dataclass
 from typing import Final
 
 
-_PREFIX: Final[str] = "ECHOTRACE"
-_HEALTH_TEMPLATE: Final[str] = f"{_PREFIX}/health/{{node_id}}"
-_TRIGGER_TEMPLATE: Final[str] = f"{_PREFIX}/trigger/{{node_id}}"
-_STATE_HUB: Final[str] = f"{_PREFIX}/state/hub"
-_CONFIG_TEMPLATE: Final[str] = f"{_PREFIX}/config/{{node_id}}"
-_ACK_TEMPLATE: Final[str] = f"{_PREFIX}/ack/{{node_id}}"
+_PREFIX: Final[str] = sys.intern("ECHOTRACE")
+_STATE_HUB: Final[str] = sys.intern(f"{_PREFIX}/state/hub")
+# A node only ever builds topics for its own id, so each set is computed once.
+_TOPIC_CACHE_SIZE: Final[int] = 256
+
+
+@dataclass(frozen=True, slots=True)
+class NodeTopics:
+    """Every MQTT topic a single node publishes or subscribes to."""
+
+    health: str
+    trigger: str
+    config: str
+    ack: str
+    hub_state: str
+
+
+@functools.lru_cache(maxsize=_TOPIC_CACHE_SIZE)
+def build_node_topics(node_id: str) -> NodeTopics:
+    """Return the topic set for ``node_id``; hold on to it rather than rebuilding strings."""
+    return NodeTopics(
+        health=f"{_PREFIX}/health/{node_id}",
+        trigger=f"{_PREFIX}/trigger/{node_id}",
+        config=f"{_PREFIX}/config/{node_id}",
+        ack=f"{_PREFIX}/ack/{node_id}",
+        hub_state=_STATE_HUB,
+    )
 
 
 def health_topic(node_id: str) -> str:
     """Return the health topic for the provided node identifier."""
-    return _HEALTH_TEMPLATE.format(node_id=node_id)
+    return build_node_topics(node_id).health
 
 
 def trigger_topic(node_id: str) -> str:
     """Return the trigger topic for the provided node identifier."""
-    return _TRIGGER_TEMPLATE.format(node_id=node_id)
+    return build_node_topics(node_id).trigger
 
 
 def hub_state_topic() -> str:
@@ -30,15 +54,17 @@ def hub_state_topic() -> str:
 
 def node_config_topic(node_id: str) -> str:
     """Return the configuration topic for this node."""
-    return _CONFIG_TEMPLATE.format(node_id=node_id)
+    return build_node_topics(node_id).config
 
 
 def node_ack_topic(node_id: str) -> str:
     """Return the acknowledgement topic for this node."""
-    return _ACK_TEMPLATE.format(node_id=node_id)
+    return build_node_topics(node_id).ack
 
 
 __all__ = [
+    "NodeTopics",
+    "build_node_topics",
     "health_topic",
     "trigger_topic",
     "hub_state_topic",
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import logging
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 import yaml  # type: ignore[import]
 
@@ -23,28 +23,33 @@ else:
     MQTTClient = Any
     MQTTMessage = Any
 
+from . import json_codec
 from .audio_player import AudioPlayer
 from .haptics import Haptics
 from .led_feedback import LedFeedback
 from .logging_utils import configure_node_logging
-from .mqtt_topics import (
-    hub_state_topic,
-    node_ack_topic,
-    node_config_topic,
-    trigger_topic,
-    health_topic,
-)
+from .mqtt_topics import build_node_topics
 from .proximity_sensor import ProximitySensor
 
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent / "node_config.yaml"
 HEARTBEAT_INTERVAL_SECONDS = 15.0
+HEARTBEAT_RETRY_SECONDS = 1.0
 RETRIGGER_COOLDOWN_SECONDS = 5.0
 STORY_RESET_SECONDS = 8.0
+# Publishes are queued for paho's network thread; these bound what it buffers offline.
+MQTT_MAX_INFLIGHT = 20
+MQTT_MAX_QUEUED = 1000
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+# Parsed node configs keyed by path and validated against (st_mtime_ns, st_size).
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+@dataclass(slots=True)
 class ProximitySettings:
     """Configuration values controlling proximity thresholds."""
 
@@ -68,7 +73,7 @@ class ProximitySettings:
                 setattr(self, key, int(values[key]))
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSettings:
     """Audio fragment metadata."""
 
@@ -89,7 +94,7 @@ class AudioSettings:
             self.volume = float(values["volume"])
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilitySettings:
     """Accessibility preferences applied at the node."""
 
@@ -150,7 +155,7 @@ class AccessibilitySettings:
         return 0.75 if self.safety_limiter else 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeConfig:
     """Aggregated node configuration."""
 
@@ -190,6 +195,33 @@ class NodeConfig:
 class NodeService:
     """Coordinate proximity sensing, audio playback, and MQTT messaging."""
 
+    __slots__ = (
+        "config_path",
+        "_raw_config",
+        "config",
+        "_topics",
+        "_sensor",
+        "_owns_sensor",
+        "_audio",
+        "_led",
+        "_haptics",
+        "_mqtt",
+        "_heartbeat_interval",
+        "_last_heartbeat_ts",
+        "_last_trigger_ts",
+        "_cooldown_until",
+        "_pending_story_at",
+        "_story_active",
+        "_story_reset_time",
+        "_mystery_played",
+        "_glow_min_mm",
+        "_glow_scale",
+        "_effective_volume",
+        "_loaded_fragment",
+        "_ack_prefix",
+        "_audio_fragment_path",
+    )
+
     def __init__(
         self,
         config_path: Path = DEFAULT_CONFIG_PATH,
@@ -204,7 +236,15 @@ class NodeService:
         self.config_path = config_path
         self._raw_config: Dict[str, Any] = {}
         self.config = self._load_config()
+        # node_id is fixed for the life of the process, so its topics are built once.
+        self._topics = build_node_topics(self.config.node_id)
+        # Every ack shares this prefix; only the applied list is encoded per message.
+        self._ack_prefix = (
+            b'{"node_id":' + json_codec.dumps(self.config.node_id) + b',"status":"ok","applied":'
+        )
 
+        # Injected sensors belong to the caller; only one opened here is closed on shutdown.
+        self._owns_sensor = sensor is None
         self._sensor = sensor or ProximitySensor()
         self._audio = audio_player or AudioPlayer()
         self._led = led_feedback or self._create_led()
@@ -212,13 +252,20 @@ class NodeService:
 
         self._mqtt = mqtt_client or self._create_mqtt_client()
         self._heartbeat_interval = HEARTBEAT_INTERVAL_SECONDS
-        self._last_heartbeat_ts = 0.0
+        # Loop timers use time.monotonic(); the first heartbeat is always due.
+        self._last_heartbeat_ts = float("-inf")
         self._last_trigger_ts = 0.0
         self._cooldown_until = 0.0
         self._pending_story_at: Optional[float] = None
         self._story_active = False
         self._story_reset_time = 0.0
         self._mystery_played = False
+        self._glow_min_mm = 0
+        self._glow_scale = 0.0
+        self._refresh_glow_scale()
+        self._effective_volume = 0.0
+        self._loaded_fragment: Optional[Path] = None
+        self._audio_fragment_path: Optional[Path] = None
 
         self._load_audio_fragment()
         self._apply_accessibility()
@@ -230,17 +277,18 @@ class NodeService:
 
     def _load_config(self) -> NodeConfig:
         try:
-            with self.config_path.open("r", encoding="utf-8") as handle:
-                self._raw_config = yaml.safe_load(handle) or {}
+            self._raw_config = _read_config_file(self.config_path)
         except FileNotFoundError:
             LOGGER.warning("Configuration missing at %s; using defaults.", self.config_path)
             self._raw_config = {}
         except yaml.YAMLError as exc:
             raise RuntimeError(f"Invalid YAML in {self.config_path}: {exc}") from exc
+        except ValueError as exc:
+            raise RuntimeError(f"Invalid JSON in {self.config_path}: {exc}") from exc
         return NodeConfig.from_dict(self._raw_config)
 
     def _load_audio_fragment(self) -> None:
-        fragment_path = self.audio_fragment_path
+        fragment_path = self._audio_fragment_path = self._resolve_audio_fragment()
         if fragment_path is None:
             LOGGER.info("No audio fragment configured for node %s.", self.config.node_id)
             return
@@ -248,13 +296,20 @@ class NodeService:
             LOGGER.warning("Audio fragment missing at %s", fragment_path)
             return
         self._audio.load(fragment_path)
+        self._loaded_fragment = fragment_path
 
     def _apply_accessibility(self) -> None:
-        self._audio.set_safety_limit(self.config.accessibility.safety_limit())
+        limit = self.config.accessibility.safety_limit()
+        self._effective_volume = min(self.config.audio.volume, limit)
+        self._audio.set_safety_limit(limit)
         self._audio.set_volume(self.config.audio.volume)
 
     @property
     def audio_fragment_path(self) -> Optional[Path]:
+        """Resolved fragment path, refreshed whenever the fragment setting is (re)loaded."""
+        return self._audio_fragment_path
+
+    def _resolve_audio_fragment(self) -> Optional[Path]:
         fragment = self.config.audio.fragment_file.strip()
         if not fragment:
             return None
@@ -269,6 +324,8 @@ class NodeService:
         if mqtt is None:
             raise RuntimeError("paho-mqtt is required for node operation.")
         client = mqtt.Client()
+        client.max_inflight_messages_set(MQTT_MAX_INFLIGHT)
+        client.max_queued_messages_set(MQTT_MAX_QUEUED)
         client.on_connect = self._on_connect
         client.on_message = self._on_message
         return client
@@ -280,9 +337,15 @@ class NodeService:
         broker_port = int(self._raw_config.get("broker_port", 1883))
         LOGGER.info("Connecting to MQTT broker at %s:%s", broker_host, broker_port)
         try:
-            self._mqtt.connect(broker_host, broker_port, keepalive=60)
-            if hasattr(self._mqtt, "loop_start"):
+            if hasattr(self._mqtt, "connect_async") and hasattr(self._mqtt, "loop_start"):
+                # The network thread connects, reconnects, and flushes publishes, so
+                # neither startup nor run_once ever waits on the socket.
+                self._mqtt.connect_async(broker_host, broker_port, keepalive=60)
                 self._mqtt.loop_start()
+            else:
+                self._mqtt.connect(broker_host, broker_port, keepalive=60)
+                if hasattr(self._mqtt, "loop_start"):
+                    self._mqtt.loop_start()
         except Exception as exc:  # pragma: no cover - requires broker
             LOGGER.error("Failed to connect to MQTT broker: %s", exc)
 
@@ -296,9 +359,9 @@ class NodeService:
         if rc != 0:
             LOGGER.error("MQTT connection failed with rc=%s", rc)
             return
-        client.subscribe(node_config_topic(self.config.node_id))
+        client.subscribe(self._topics.config)
         if self.config.role == "mystery":
-            client.subscribe(hub_state_topic())
+            client.subscribe(self._topics.hub_state)
 
     def _on_message(
         self,
@@ -311,55 +374,63 @@ class NodeService:
 
     def handle_mqtt_message(self, topic: str, payload: str) -> None:
         """Handle inbound MQTT messages; exposed for unit testing."""
-        if topic == node_config_topic(self.config.node_id):
+        if topic == self._topics.config:
             self._handle_config_message(payload)
-        elif topic == hub_state_topic() and self.config.role == "mystery":
+        elif topic == self._topics.hub_state and self.config.role == "mystery":
             self._handle_state_message(payload)
         else:
             LOGGER.debug("Unhandled MQTT topic %s", topic)
 
     def _handle_config_message(self, payload: str) -> None:
         try:
-            data = json.loads(payload or "{}")
-        except json.JSONDecodeError:
+            data = json_codec.loads(payload or "{}")
+        except ValueError:
             LOGGER.warning("Invalid configuration payload: %s", payload)
             return
         if not isinstance(data, dict):
             LOGGER.warning("Configuration payload must be an object.")
             return
 
+        # Pushes often repeat the current settings, so side effects run only on real changes.
         applied: list[str] = []
+        refresh_volume = False
         if "audio" in data and isinstance(data["audio"], dict):
-            self.config.audio.update(data["audio"])
-            self._load_audio_fragment()
+            audio = self.config.audio
+            previous_fragment, previous_volume = audio.fragment_file, audio.volume
+            audio.update(data["audio"])
+            if audio.fragment_file != previous_fragment:
+                self._load_audio_fragment()
+            refresh_volume = audio.volume != previous_volume
             applied.append("audio")
         if "proximity" in data and isinstance(data["proximity"], dict):
+            previous_proximity = copy.copy(self.config.proximity)
             self.config.proximity.update(data["proximity"])
+            if self.config.proximity != previous_proximity:
+                self._refresh_glow_scale()
             applied.append("proximity")
         if "accessibility" in data and isinstance(data["accessibility"], dict):
+            previous_limit = self.config.accessibility.safety_limit()
             self.config.accessibility.update(data["accessibility"])
-            self._apply_accessibility()
+            refresh_volume = refresh_volume or (
+                self.config.accessibility.safety_limit() != previous_limit
+            )
             applied.append("accessibility")
+        if refresh_volume:
+            self._apply_accessibility()
 
-        ack_payload = json.dumps(
-            {
-                "node_id": self.config.node_id,
-                "status": "ok",
-                "applied": applied,
-            }
-        )
-        self._mqtt.publish(node_ack_topic(self.config.node_id), ack_payload, qos=1)
+        ack_payload = self._ack_prefix + json_codec.dumps(applied) + b"}"
+        self._mqtt.publish(self._topics.ack, ack_payload, qos=1)
 
     def _handle_state_message(self, payload: str) -> None:
         try:
-            data = json.loads(payload or "{}")
-        except json.JSONDecodeError:
+            data = json_codec.loads(payload or "{}")
+        except ValueError:
             LOGGER.warning("Invalid hub state payload: %s", payload)
             return
         unlocked = bool(data.get("unlocked"))
         if unlocked and not self._mystery_played:
             LOGGER.info("Narrative unlocked; playing finale fragment on %s.", self.config.node_id)
-            now = time.time()
+            now = time.monotonic()
             self._start_story(now, force=True, mystery=True)
             self._mystery_played = True
         elif not unlocked:
@@ -393,7 +464,7 @@ class NodeService:
 
     def run_once(self, now: Optional[float] = None) -> Dict[str, Any]:
         """Execute a single iteration of the service loop; returns telemetry for testing."""
-        timestamp = now if now is not None else time.time()
+        timestamp = now if now is not None else time.monotonic()
         distance = self._sensor.read_distance_mm()
 
         self._process_distance(distance, timestamp)
@@ -420,41 +491,53 @@ class NodeService:
         except KeyboardInterrupt:
             LOGGER.info("Node service terminated by operator.")
         finally:
-            if hasattr(self._mqtt, "loop_stop"):
-                self._mqtt.loop_stop()
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Release resources the service created itself and stop the MQTT network loop."""
+        if self._owns_sensor:
+            self._owns_sensor = False  # a repeated shutdown must not close the sensor again
+            self._sensor.close()
+        if hasattr(self._mqtt, "loop_stop"):
+            self._mqtt.loop_stop()
 
     # ------------------------------------------------------------------ Distance handling
 
     def _process_distance(self, distance: Optional[int], now: float) -> None:
-        if self.config.role == "mystery":
+        # Runs on every sensor poll; attributes used more than once are read into locals.
+        config = self.config
+        if config.role == "mystery":
             return  # mystery nodes react to hub state instead of proximity
 
+        led = self._led
         if distance is None:
             self._cancel_pending_story()
-            if self._led and not self._story_active:
-                self._led.off()
+            if led and not self._story_active:
+                led.off()
             return
 
-        proximity = self.config.proximity
-        start_threshold = proximity.story_threshold_mm - proximity.hysteresis_mm
-
-        if distance <= start_threshold:
+        proximity = config.proximity
+        if distance <= proximity.story_threshold_mm - proximity.hysteresis_mm:
             self._queue_story(now)
-        else:
-            self._cancel_pending_story()
-            if self._led:
-                if self.config.accessibility.proximity_glow:
-                    intensity = self._calculate_glow(distance)
-                    self._led.glow(intensity)
-                elif not self._story_active:
-                    self._led.off()
+            return
+
+        self._cancel_pending_story()
+        if led:
+            if config.accessibility.proximity_glow:
+                led.glow(self._calculate_glow(distance))
+            elif not self._story_active:
+                led.off()
 
     def _calculate_glow(self, distance: int) -> float:
-        proximity = self.config.proximity
-        span = max(1, proximity.max_mm - proximity.min_mm)
-        value = 1.0 - max(0.0, min(1.0, (distance - proximity.min_mm) / span))
+        value = 1.0 - (distance - self._glow_min_mm) * self._glow_scale
         return max(0.0, min(1.0, value))
 
+    def _refresh_glow_scale(self) -> None:
+        # Proximity bounds only change with config, so the per-tick division is hoisted here.
+        proximity = self.config.proximity
+        self._glow_min_mm = proximity.min_mm
+        self._glow_scale = 1.0 / max(1, proximity.max_mm - proximity.min_mm)
+
     def _queue_story(self, now: float) -> None:
         if self._story_active or now < self._cooldown_until:
             return
@@ -481,8 +564,11 @@ class NodeService:
             LOGGER.warning("Unable to play story; audio fragment missing.")
             return
 
-        self._audio.load(fragment_path)
-        self._apply_accessibility()
+        if fragment_path != self._loaded_fragment:
+            self._audio.load(fragment_path)
+            self._loaded_fragment = fragment_path
+        # Volume and safety limit only change via config, which recomputes this value.
+        self._audio.set_volume(self._effective_volume)
         self._audio.play(
             loop=self.config.accessibility.repeat > 0,
             pace=self.config.accessibility.pace,
@@ -503,14 +589,14 @@ class NodeService:
         if self._haptics:
             self._haptics.pulse(180)
 
-        trigger_payload = json.dumps(
+        trigger_payload = json_codec.dumps(
             {
                 "node_id": self.config.node_id,
                 "role": self.config.role,
-                "ts": now,
+                "ts": time.time(),
             }
         )
-        self._mqtt.publish(trigger_topic(self.config.node_id), trigger_payload, qos=1)
+        self._mqtt.publish(self._topics.trigger, trigger_payload, qos=1)
 
     def _update_story_state(self, now: float) -> None:
         if self._story_active and now >= self._story_reset_time:
@@ -523,22 +609,51 @@ class NodeService:
     def _publish_heartbeat_if_due(self, now: float) -> Optional[Dict[str, Any]]:
         if now - self._last_heartbeat_ts < self._heartbeat_interval:
             return None
+        is_connected = getattr(self._mqtt, "is_connected", None)
+        if is_connected is not None and not is_connected():
+            # QoS 0 heartbeats are useless once stale; retry shortly instead of queueing.
+            self._last_heartbeat_ts = now - self._heartbeat_interval + HEARTBEAT_RETRY_SECONDS
+            return None
 
+        # The hub derives node age from this wall-clock epoch, not the monotonic loop clock.
         payload = {
             "node_id": self.config.node_id,
             "role": self.config.role,
-            "ts": now,
+            "ts": time.time(),
         }
-        message = json.dumps(payload)
-        info = self._mqtt.publish(health_topic(self.config.node_id), message, qos=0)
+        message = json_codec.dumps(payload)
+        info = self._mqtt.publish(self._topics.health, message, qos=0)
         if hasattr(info, "rc") and info.rc != 0:
             LOGGER.warning("Heartbeat publish returned rc=%s", info.rc)
         self._last_heartbeat_ts = now
         return payload
 
 
+def _read_config_file(path: Path) -> Dict[str, Any]:
+    """
+    Parse a node config, reusing the previous parse while the file is unchanged.
+
+    Files ending in ``.json`` are read as JSON; anything else is parsed as YAML.
+    """
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != signature:
+        if path.suffix == ".json":
+            data = json_codec.loads(path.read_bytes()) or {}
+        else:
+            with path.open("r", encoding="utf-8") as handle:
+                data = yaml.load(handle, Loader=YAML_LOADER) or {}  # noqa: S506
+        cached = (signature, data)
+        _CONFIG_CACHE[path] = cached
+    # NodeConfig and _raw_config are mutated at runtime, so never share the cached dict.
+    return copy.deepcopy(cached[1])
+
+
 def main() -> None:  # pragma: no cover - script entry point
     configure_node_logging()
+    if YAML_LOADER is yaml.SafeLoader:
+        LOGGER.warning("PyYAML was built without libyaml; config parsing uses the slow loader.")
     NodeService(auto_connect=True).run_forever()
 
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Optional
+import threading
+from typing import Any, Dict, Iterable, Optional
 
 LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +17,10 @@ except ImportError:  # pragma: no cover - executed in development environments
     busio = None  # type: ignore[assignment]
     adafruit_vl53l1x = None  # type: ignore[assignment]
 
+# One busio.I2C per bus speed for the whole process; re-creating sensors reuses it.
+_I2C_BUSES: Dict[Optional[int], Any] = {}
+_I2C_LOCK = threading.Lock()
+
 
 class ProximitySensor:
     """Read distance measurements from a VL53L1X sensor with graceful fallback."""
@@ -23,19 +28,19 @@ class ProximitySensor:
     def __init__(self, i2c_bus: Optional[int] = None, address: Optional[int] = None) -> None:
         self._fallback_distance = 900
         self._sensor = None
+        # Latest completed measurement; the sensor ranges continuously in the background.
+        self._last_distance: Optional[int] = self._fallback_distance
 
         if board is None or busio is None or adafruit_vl53l1x is None:
             LOGGER.info("VL53L1X dependencies unavailable; using fallback distances.")
             return
 
         try:  # pragma: no cover - requires hardware
-            if i2c_bus is not None:
-                i2c = busio.I2C(board.SCL, board.SDA, frequency=400000)
-            else:
-                i2c = busio.I2C(board.SCL, board.SDA)
+            i2c = _shared_i2c(400000 if i2c_bus is not None else None)
             self._sensor = adafruit_vl53l1x.VL53L1X(i2c, address=address)
             self._sensor.distance_mode = 1  # short range for museum settings
             self._sensor.timing_budget = 33
+            self._sensor.start_ranging()
             LOGGER.info("VL53L1X sensor initialised successfully.")
         except Exception as exc:  # pragma: no cover - requires hardware
             self._sensor = None
@@ -46,14 +51,43 @@ class ProximitySensor:
         if self._sensor is None:
             return self._fallback_distance
         try:  # pragma: no cover - requires hardware
-            distance = self._sensor.distance
-            if distance is None:
-                return None
-            return int(distance)
+            # Only touch the bus for a finished sample; otherwise reuse the last one.
+            if self._sensor.data_ready:
+                distance = self._sensor.distance
+                self._sensor.clear_interrupt()
+                self._last_distance = None if distance is None else int(distance)
+            return self._last_distance
         except Exception as exc:
             LOGGER.debug("Error reading distance: %s", exc)
             return None
 
+    def close(self) -> None:
+        """
+        Stop continuous ranging and detach the sensor; later calls are no-ops.
+
+        The shared I2C bus stays open so other sensors in the process keep working.
+        """
+        sensor, self._sensor = self._sensor, None
+        if sensor is None:
+            return
+        try:  # pragma: no cover - requires hardware
+            sensor.stop_ranging()
+        except Exception as exc:
+            LOGGER.debug("Error stopping VL53L1X ranging: %s", exc)
+
+
+def _shared_i2c(frequency: Optional[int]) -> Any:
+    """Return the process-wide I2C bus for ``frequency``, opening it on first use."""
+    with _I2C_LOCK:
+        bus = _I2C_BUSES.get(frequency)
+        if bus is None:  # pragma: no cover - requires hardware
+            if frequency is not None:
+                bus = busio.I2C(board.SCL, board.SDA, frequency=frequency)
+            else:
+                bus = busio.I2C(board.SCL, board.SDA)
+            _I2C_BUSES[frequency] = bus
+        return bus
+
 
 class MockProximitySensor(ProximitySensor):
     """Simple mockable proximity sensor used in tests."""
@@ -61,14 +95,12 @@ class MockProximitySensor(ProximitySensor):
     def __init__(self, distances: Optional[Iterable[int | None]] = None) -> None:
         super().__init__()
         self._distances = list(distances or [900])
-        self._index = 0
+        # Replay the sequence once, then keep reporting its final reading.
+        self._remaining = iter(self._distances)
+        self._last = self._distances[-1]
 
     def read_distance_mm(self) -> Optional[int]:
-        if not self._distances:
-            return None
-        result = self._distances[min(self._index, len(self._distances) - 1)]
-        self._index += 1
-        return result
+        return next(self._remaining, self._last)
 
 
 __all__ = ["ProximitySensor", "MockProximitySensor"]
@@ -0,0 +1,44 @@
+"""Tests for accessibility profile persistence helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from hub.accessibility_store import derive_runtime_payloads, load_profiles, save_profiles
+
+
+def test_load_profiles_shares_the_cached_parse(tmp_path: Path) -> None:
+    """Unchanged files return the cached profiles without copying them."""
+    profiles_path = tmp_path / "profiles.yaml"
+    save_profiles({"global": {"captions": False}}, profiles_path)
+
+    first = load_profiles(profiles_path)
+    assert load_profiles(profiles_path) is first
+
+
+def test_save_profiles_invalidates_cache(tmp_path: Path) -> None:
+    """Saving profiles should be visible to the next load."""
+    profiles_path = tmp_path / "profiles.yaml"
+    save_profiles({"global": {"captions": False}}, profiles_path)
+    assert load_profiles(profiles_path)["global"]["captions"] is False
+
+    save_profiles({"global": {"captions": True}}, profiles_path)
+    assert load_profiles(profiles_path)["global"]["captions"] is True
+
+
+def test_derive_runtime_payloads_applies_globals_and_overrides() -> None:
+    """Nodes without overrides inherit globals; overrides replace individual values."""
+    profiles = {
+        "global": {"captions": True, "sensory_friendly": True, "mobility_buffer_ms": 1000},
+        "per_node_overrides": {"object2": {"volume": 0.3, "repeat": 1}},
+    }
+
+    payloads = derive_runtime_payloads(profiles, {"object1": {}, "object2": {}})
+
+    assert payloads["object1"]["audio"]["volume"] == 0.55
+    assert payloads["object1"]["accessibility"]["captions"] is True
+    assert payloads["object1"]["accessibility"]["pace"] == 0.9
+    assert payloads["object1"]["accessibility"]["mobility_buffer_ms"] == 1000
+    assert payloads["object2"]["audio"]["volume"] == 0.3
+    assert payloads["object2"]["accessibility"]["repeat"] == 1
+    assert payloads["object2"]["accessibility"]["captions"] is True
@@ -6,46 +6,29 @@ import csv
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from hub.event_logging import summarize_events
+import pytest
+
+from hub.event_logging import latest_event_csv, summarize_events
+
+
+_LOG_EVENTS = [
+    (0, "fragment_triggered", "object1"),
+    (30, "fragment_triggered", "object1"),
+    (0, "heartbeat_received", "object1"),
+    (0, "narrative_unlocked", "mystery"),
+]
 
 
 def _write_log(log_path: Path) -> None:
+    base_time = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    rows = [
+        ((base_time + timedelta(seconds=offset)).isoformat(), event, node_id, "{}")
+        for offset, event, node_id in _LOG_EVENTS
+    ]
     with log_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=["timestamp", "event", "node_id", "detail"])
-        writer.writeheader()
-        base_time = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
-        writer.writerow(
-            {
-                "timestamp": base_time.isoformat(),
-                "event": "fragment_triggered",
-                "node_id": "object1",
-                "detail": "{}",
-            }
-        )
-        writer.writerow(
-            {
-                "timestamp": (base_time + timedelta(seconds=30)).isoformat(),
-                "event": "fragment_triggered",
-                "node_id": "object1",
-                "detail": "{}",
-            }
-        )
-        writer.writerow(
-            {
-                "timestamp": base_time.isoformat(),
-                "event": "heartbeat_received",
-                "node_id": "object1",
-                "detail": "{}",
-            }
-        )
-        writer.writerow(
-            {
-                "timestamp": base_time.isoformat(),
-                "event": "narrative_unlocked",
-                "node_id": "mystery",
-                "detail": "{}",
-            }
-        )
+        writer = csv.writer(handle)
+        writer.writerow(["timestamp", "event", "node_id", "detail"])
+        writer.writerows(rows)
 
 
 def test_summarize_events(tmp_path: Path) -> None:
@@ -62,3 +45,51 @@ def test_summarize_events(tmp_path: Path) -> None:
     assert 0.4 <= summary.completion_rate <= 1.0
     assert summary.mean_trigger_interval_seconds == 30
     assert summary.recent_events, "Expected recent events to be populated."
+
+
+def test_latest_event_csv_picks_newest_day(tmp_path: Path) -> None:
+    """The newest ISO-dated log wins and empty directories yield None."""
+    assert latest_event_csv(tmp_path) is None
+    (tmp_path / "2025-01-02_events.csv").write_text("", encoding="utf-8")
+    (tmp_path / "2025-01-10_events.csv").write_text("", encoding="utf-8")
+    assert latest_event_csv(tmp_path) == tmp_path / "2025-01-10_events.csv"
+
+
+def test_summarize_events_refreshes_after_append(tmp_path: Path) -> None:
+    """Cached summaries are replaced once the log grows."""
+    log_path = tmp_path / "2025-01-01_events.csv"
+    _write_log(log_path)
+    assert summarize_events(tmp_path).total_triggers == 2  # type: ignore[union-attr]
+
+    with log_path.open("a", encoding="utf-8", newline="") as handle:
+        handle.write("2025-01-01T12:05:00+00:00,fragment_triggered,object2,{}\n")
+    summary = summarize_events(tmp_path)
+    assert summary is not None
+    assert summary.total_triggers == 3
+
+
+def test_cached_summary_is_shared_and_read_only(tmp_path: Path) -> None:
+    """Unchanged logs return the same summary, which callers cannot mutate."""
+    _write_log(tmp_path / "2025-01-01_events.csv")
+    summary = summarize_events(tmp_path)
+    assert summary is not None
+    assert summarize_events(tmp_path) is summary
+
+    with pytest.raises(TypeError):
+        summary.by_node["object1"] = 0  # type: ignore[index]
+    with pytest.raises(TypeError):
+        summary.recent_events[0]["event"] = "edited"  # type: ignore[index]
+
+
+def test_blank_lines_are_not_reported_as_events(tmp_path: Path) -> None:
+    """Blank lines in the log are skipped rather than surfacing as empty recent events."""
+    log_path = tmp_path / "2025-01-01_events.csv"
+    _write_log(log_path)
+    with log_path.open("a", encoding="utf-8", newline="") as handle:
+        handle.write("\n\n2025-01-01T12:05:00+00:00,fragment_triggered,object2,{}\n\n")
+
+    summary = summarize_events(tmp_path)
+    assert summary is not None
+    assert summary.total_triggers == 3
+    assert len(summary.recent_events) == 5
+    assert all(event["event"] for event in summary.recent_events)
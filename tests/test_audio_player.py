@@ -0,0 +1,79 @@
+"""Tests for the node audio player wrapper."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from pi_nodes import audio_player
+from pi_nodes.audio_player import AudioPlayer
+
+
+class RecordingMusic:
+    """Stand-in for pygame.mixer.music that records calls."""
+
+    def __init__(self) -> None:
+        self.calls: List[tuple[str, Any]] = []
+
+    def load(self, path: str) -> None:
+        self.calls.append(("load", path))
+
+    def play(self, loops: int = 0) -> None:
+        self.calls.append(("play", loops))
+
+    def stop(self) -> None:
+        self.calls.append(("stop", None))
+
+    def set_volume(self, value: float) -> None:
+        self.calls.append(("volume", value))
+
+
+@pytest.fixture
+def music(monkeypatch: pytest.MonkeyPatch) -> RecordingMusic:
+    recorder = RecordingMusic()
+    fake_mixer = SimpleNamespace(music=recorder, get_init=lambda: True, init=lambda **_: None)
+    monkeypatch.setattr(audio_player, "mixer", fake_mixer)
+    return recorder
+
+
+def test_mixer_is_initialised_with_a_short_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The mixer is opened with an explicit low-latency buffer that callers can raise."""
+    init_calls: List[dict[str, int]] = []
+    fake_mixer = SimpleNamespace(
+        music=RecordingMusic(),
+        get_init=lambda: bool(init_calls),
+        init=lambda **kwargs: init_calls.append(kwargs),
+    )
+    monkeypatch.setattr(audio_player, "mixer", fake_mixer)
+
+    AudioPlayer(buffer_samples=1024)
+
+    assert init_calls == [{"frequency": 48000, "size": -16, "channels": 2, "buffer": 1024}]
+
+
+def test_clip_is_opened_once_and_replayed(music: RecordingMusic, tmp_path: Path) -> None:
+    """Reloading the same clip before each play does not reopen it in the mixer."""
+    clip = tmp_path / "clip.mp3"
+    player = AudioPlayer()
+
+    player.load(clip)
+    player.play()
+    player.load(clip)
+    player.play(repeat=2)
+
+    assert music.calls == [("load", str(clip)), ("play", 0), ("play", 2)]
+
+
+def test_loading_a_new_clip_replaces_the_mixer_source(
+    music: RecordingMusic, tmp_path: Path
+) -> None:
+    """Switching fragments opens the new file before it is played."""
+    player = AudioPlayer()
+    player.load(tmp_path / "first.mp3")
+    player.load(tmp_path / "second.mp3")
+    player.play(loop=True)
+
+    assert music.calls[-2:] == [("load", str(tmp_path / "second.mp3")), ("play", -1)]
@@ -0,0 +1,41 @@
+"""Tests for hub configuration loading and validation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from hub.config_loader import ConfigError, load_config
+
+
+def test_load_config_applies_defaults(tmp_path: Path) -> None:
+    """Missing keys and sections fall back to documented defaults."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"logs_dir: {tmp_path / 'logs'}\nbroker_port: 1884\n", encoding="utf-8")
+
+    config = load_config(config_path)
+
+    assert config.broker_host == "localhost"
+    assert config.broker_port == 1884
+    assert config.logs_dir.is_dir()
+    assert config.narrative.required_fragments_to_unlock == 4
+    assert config.security.require_basic_auth is True
+
+
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        ("broker_port: 0\n", "'broker_port' must be >= 1"),
+        ("dashboard_host: ''\n", "'dashboard_host' must be a non-empty string"),
+        ("analytics: [1]\n", "Section 'analytics' must be a mapping/object"),
+        ("security:\n  require_basic_auth: 'yes'\n", "'require_basic_auth' must be a boolean"),
+    ],
+)
+def test_load_config_rejects_invalid_values(tmp_path: Path, body: str, message: str) -> None:
+    """Invalid values raise ConfigError with a targeted message."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"logs_dir: {tmp_path / 'logs'}\n{body}", encoding="utf-8")
+
+    with pytest.raises(ConfigError, match=message):
+        load_config(config_path)
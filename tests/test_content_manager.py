@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
+import pytest
 import yaml  # type: ignore[import]
 
 from hub.content_manager import ContentManager
+from hub.yaml_io import YAML_DUMPER
 
 
-def test_content_manager_loads_pack(tmp_path: Path) -> None:
-    """Ensure a content pack is parsed and fragment lookup works."""
-    pack_dir = tmp_path / "sample-pack"
+def _dump(data: dict[str, Any]) -> str:
+    text: str = yaml.dump(data, Dumper=YAML_DUMPER)
+    return text
+
+
+@pytest.fixture(scope="session")
+def sample_pack(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a read-only packs root with one English-only pack, once per session."""
+    packs_root = tmp_path_factory.mktemp("packs")
+    pack_dir = packs_root / "sample-pack"
     transcripts_dir = pack_dir / "transcripts"
     audio_dir = pack_dir / "audio"
     transcripts_dir.mkdir(parents=True)
@@ -34,32 +44,41 @@ def test_content_manager_loads_pack(tmp_path: Path) -> None:
             },
         },
     }
-    (pack_dir / "pack.yaml").write_text(yaml.safe_dump(pack_yaml), encoding="utf-8")
+    (pack_dir / "pack.yaml").write_text(_dump(pack_yaml), encoding="utf-8")
+    return packs_root
 
-    manager = ContentManager(packs_root=tmp_path)
-    manager.load_pack("sample-pack")
+
+def test_content_manager_loads_pack(sample_pack: Path) -> None:
+    """Ensure a content pack is parsed and fragment lookup works."""
+    manager = ContentManager(packs_root=sample_pack)
+    pack = manager.load_pack("sample-pack")
+    assert pack.default_assignments == {"object1": pack.media[("object1", "en")]}
 
     fragment_path = manager.get_fragment_for_node("object1", "en")
-    assert fragment_path == audio_dir / "object1_en.mp3"
+    assert fragment_path == sample_pack / "sample-pack" / "audio" / "object1_en.mp3"
 
     transcript_url = manager.get_transcript_url("object1", "en")
     assert transcript_url is not None
     assert transcript_url.endswith("/object1_en.html")
 
 
-def test_content_manager_language_fallback(tmp_path: Path) -> None:
+def test_content_manager_language_fallback(sample_pack: Path) -> None:
     """Verify requested language falls back to node default when missing."""
-    pack_dir = tmp_path / "fallback-pack"
-    transcripts_dir = pack_dir / "transcripts"
+    manager = ContentManager(packs_root=sample_pack)
+    manager.load_pack("sample-pack")
+
+    fragment_path = manager.get_fragment_for_node("object1", "fr")
+    assert fragment_path == sample_pack / "sample-pack" / "audio" / "object1_en.mp3"
+
+
+def test_content_manager_invalidate_rechecks_assets(tmp_path: Path) -> None:
+    """Assets added after loading are picked up once the manager is invalidated."""
+    pack_dir = tmp_path / "late-pack"
     audio_dir = pack_dir / "audio"
-    transcripts_dir.mkdir(parents=True)
     audio_dir.mkdir(parents=True)
 
-    (audio_dir / "object1_en.mp3").write_text("dummy audio", encoding="utf-8")
-    (transcripts_dir / "object1_en.html").write_text("<p>Transcript</p>", encoding="utf-8")
-
     pack_yaml = {
-        "name": "fallback-pack",
+        "name": "late-pack",
         "nodes": {
             "object1": {"role": "whisper", "default_language": "en"},
         },
@@ -72,10 +91,101 @@ def test_content_manager_language_fallback(tmp_path: Path) -> None:
             },
         },
     }
-    (pack_dir / "pack.yaml").write_text(yaml.safe_dump(pack_yaml), encoding="utf-8")
+    (pack_dir / "pack.yaml").write_text(_dump(pack_yaml), encoding="utf-8")
 
     manager = ContentManager(packs_root=tmp_path)
-    manager.load_pack("fallback-pack")
+    manager.load_pack("late-pack")
+    assert manager.get_fragment_for_node("object1", "en") is None
 
-    fragment_path = manager.get_fragment_for_node("object1", "fr")
-    assert fragment_path == audio_dir / "object1_en.mp3"
+    (audio_dir / "object1_en.mp3").write_text("dummy audio", encoding="utf-8")
+    assert manager.get_fragment_for_node("object1", "en") is None
+
+    manager.invalidate()
+    assert manager.get_fragment_for_node("object1", "en") == audio_dir / "object1_en.mp3"
+
+
+def test_list_packs_notices_new_directories(tmp_path: Path) -> None:
+    """Cached pack listings refresh when the packs root changes."""
+    (tmp_path / "alpha").mkdir()
+    (tmp_path / "notes.txt").write_text("not a pack", encoding="utf-8")
+
+    manager = ContentManager(packs_root=tmp_path)
+    assert manager.list_packs() == ["alpha"]
+
+    (tmp_path / "beta").mkdir()
+    assert manager.list_packs() == ["alpha", "beta"]
+
+
+def test_load_pack_reuses_unchanged_pack(tmp_path: Path) -> None:
+    """Reloading an unchanged pack returns the cached instance until pack.yaml changes."""
+    pack_dir = tmp_path / "cached-pack"
+    pack_dir.mkdir()
+    pack_yaml = pack_dir / "pack.yaml"
+    pack_yaml.write_text(
+        _dump({"nodes": {"object1": {"role": "whisper", "default_language": "en"}}}),
+        encoding="utf-8",
+    )
+
+    manager = ContentManager(packs_root=tmp_path)
+    first = manager.load_pack("cached-pack")
+    assert manager.load_pack("cached-pack") is first
+
+    pack_yaml.write_text(
+        _dump({"nodes": {"object2": {"role": "whisper", "default_language": "fr"}}}),
+        encoding="utf-8",
+    )
+    reloaded = manager.load_pack("cached-pack")
+    assert reloaded is not first
+    assert list(reloaded.nodes) == ["object2"]
+
+
+def test_missing_media_is_logged_once_per_pack(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Repeated lookups for a broken asset should not flood the log."""
+    pack_dir = tmp_path / "broken-pack"
+    pack_dir.mkdir()
+    pack_yaml = {
+        "nodes": {"object1": {"role": "whisper", "default_language": "en"}},
+        "media": {
+            "object1": {
+                "en": {
+                    "audio": "audio/object1_en.mp3",
+                    "transcript": "transcripts/object1_en.html",
+                },
+            },
+        },
+    }
+    (pack_dir / "pack.yaml").write_text(_dump(pack_yaml), encoding="utf-8")
+
+    manager = ContentManager(packs_root=tmp_path)
+    manager.load_pack("broken-pack")
+    caplog.clear()
+    for _ in range(3):
+        assert manager.get_fragment_for_node("object1", "en") is None
+
+    missing = [rec for rec in caplog.records if "Audio asset missing" in rec.getMessage()]
+    assert len(missing) == 1
+
+
+def test_non_string_language_keys_do_not_break_loading(tmp_path: Path) -> None:
+    """YAML 1.1 reads a bare ``no`` language key as False; the pack must still load."""
+    pack_dir = tmp_path / "norsk-pack"
+    pack_dir.mkdir()
+    (pack_dir / "pack.yaml").write_text(
+        "nodes:\n"
+        "  n1: {role: whisper, default_language: en}\n"
+        "  n2: {role: whisper, default_language: en}\n"
+        "media:\n"
+        "  n1:\n"
+        "    en: {audio: audio/n1_en.mp3, transcript: transcripts/n1_en.html}\n"
+        "    no: {audio: audio/n1_no.mp3, transcript: transcripts/n1_no.html}\n"
+        "  n2:\n"
+        "    en: {audio: audio/n2_en.mp3, transcript: transcripts/n2_en.html}\n",
+        encoding="utf-8",
+    )
+
+    manager = ContentManager(packs_root=tmp_path)
+    pack = manager.load_pack("norsk-pack")
+
+    assert set(pack.effective_media["n2"]) == {"en"}
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import base64
-import os
+import dataclasses
+import io
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
 import pytest
 import yaml  # type: ignore[import]
 
+from hub.yaml_io import YAML_LOADER
+
 
 class FakeHubController:
     """Capture configuration pushes without requiring a live broker."""
@@ -22,16 +25,11 @@ class FakeHubController:
         return True
 
 
-def _auth_header() -> dict[str, str]:
-    token = base64.b64encode(b"admin:secret").decode("utf-8")
-    return {"Authorization": f"Basic {token}"}
+_AUTH_HEADER = {"Authorization": "Basic " + base64.b64encode(b"admin:secret").decode("utf-8")}
 
 
 @pytest.fixture()
 def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    os.environ.setdefault("ECHOTRACE_ADMIN_USER", "admin")
-    os.environ.setdefault("ECHOTRACE_ADMIN_PASS", "secret")
-
     import hub.accessibility_store as store
 
     cloned_path = tmp_path / "accessibility_profiles.yaml"
@@ -59,7 +57,7 @@ def test_overview_requires_auth(client) -> None:
     response = testing_client.get("/")
     assert response.status_code == 401
 
-    authed = testing_client.get("/", headers=_auth_header())
+    authed = testing_client.get("/", headers=_AUTH_HEADER)
     assert authed.status_code == 200
     assert b"Installation Snapshot" in authed.data
 
@@ -67,13 +65,13 @@ def test_overview_requires_auth(client) -> None:
 def test_api_state_and_reset(client) -> None:
     """Check narrative state JSON surfaces and resets."""
     testing_client, _controller, _path = client
-    state_resp = testing_client.get("/api/state", headers=_auth_header())
+    state_resp = testing_client.get("/api/state", headers=_AUTH_HEADER)
     assert state_resp.status_code == 200
     payload = state_resp.get_json()
     assert "unlocked" in payload
     assert "triggered" in payload
 
-    reset_resp = testing_client.post("/api/reset-state", headers=_auth_header())
+    reset_resp = testing_client.post("/api/reset-state", headers=_AUTH_HEADER)
     assert reset_resp.status_code == 200
     reset_payload = reset_resp.get_json()
     assert reset_payload["ok"] is True
@@ -86,7 +84,7 @@ def test_apply_preset_triggers_push(client) -> None:
     response = testing_client.post(
         "/api/apply_preset",
         json={"preset_name": "hard_of_hearing"},
-        headers=_auth_header(),
+        headers=_AUTH_HEADER,
     )
     assert response.status_code == 200
     data = response.get_json()
@@ -107,7 +105,7 @@ def test_set_per_node_override_updates_yaml(client) -> None:
     response = testing_client.post(
         "/api/accessibility/override",
         json={"node_id": "object1", "overrides": node_override},
-        headers=_auth_header(),
+        headers=_AUTH_HEADER,
     )
     assert response.status_code == 200
     payload = response.get_json()
@@ -115,12 +113,180 @@ def test_set_per_node_override_updates_yaml(client) -> None:
     assert controller.calls, "Expected override to push configuration."
     assert "object1" in payload["push"]
 
-    stored = yaml.safe_load(profiles_path.read_text(encoding="utf-8"))
+    with profiles_path.open("rb") as handle:
+        stored = yaml.load(handle, Loader=YAML_LOADER)  # noqa: S506
     assert stored["per_node_overrides"]["object1"]["visual_pulse"] is True
 
 
 def test_analytics_summary_no_data(client) -> None:
     """Analytics summary should report lack of data gracefully."""
     testing_client, _controller, _path = client
-    response = testing_client.get("/api/analytics/summary", headers=_auth_header())
+    response = testing_client.get("/api/analytics/summary", headers=_AUTH_HEADER)
     assert response.status_code == 404
+
+
+def test_api_state_cache_cleared_on_reset(client) -> None:
+    """Cached state payloads must not outlive a reset."""
+    testing_client, _controller, _path = client
+    app = testing_client.application
+    ctx = app.config["DASHBOARD_CONTEXT"]
+    ctx.narrative_state.register_trigger("cached-node")
+    cached = testing_client.get("/api/state", headers=_AUTH_HEADER).get_json()
+    assert "cached-node" in cached["triggered"]
+
+    testing_client.post("/api/reset-state", headers=_AUTH_HEADER)
+    state = testing_client.get("/api/state", headers=_AUTH_HEADER).get_json()
+    assert state["triggered"] == []
+
+
+def test_api_state_honours_if_none_match(client) -> None:
+    """Unchanged polled payloads answer with 304 and no body."""
+    testing_client, _controller, _path = client
+    first = testing_client.get("/api/state", headers=_AUTH_HEADER)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    headers = {**_AUTH_HEADER, "If-None-Match": etag}
+    second = testing_client.get("/api/state", headers=headers)
+    assert second.status_code == 304
+    assert second.data == b""
+
+
+def test_malformed_json_body_rejected(client) -> None:
+    """Undecodable JSON bodies surface as a 400 rather than a server error."""
+    testing_client, _controller, _path = client
+    response = testing_client.post(
+        "/api/select-pack",
+        data=b"{not json",
+        headers={**_AUTH_HEADER, "Content-Type": "application/json"},
+    )
+    assert response.status_code == 400
+
+
+def test_serve_transcript_blocks_traversal(client) -> None:
+    """Transcripts are served from the pack directory only."""
+    testing_client, _controller, _path = client
+    ok = testing_client.get("/transcripts/sample-pack/mystery_en.html")
+    assert ok.status_code == 200
+
+    escaped = testing_client.get("/transcripts/sample-pack/..%2F..%2Fpack.html")
+    assert escaped.status_code == 404
+
+
+def test_serve_transcript_supports_conditional_get(client) -> None:
+    """Repeat transcript views revalidate instead of re-downloading."""
+    testing_client, _controller, _path = client
+    first = testing_client.get("/transcripts/sample-pack/mystery_en.html")
+    etag = first.headers["ETag"]
+
+    repeat = testing_client.get(
+        "/transcripts/sample-pack/mystery_en.html", headers={"If-None-Match": etag}
+    )
+    assert repeat.status_code == 304
+
+
+def test_accessibility_page_reflects_new_override(client) -> None:
+    """Cached pages are re-rendered after accessibility changes."""
+    testing_client, _controller, _path = client
+    assert testing_client.get("/accessibility", headers=_AUTH_HEADER).status_code == 200
+
+    testing_client.post(
+        "/api/accessibility/override",
+        json={"node_id": "object1", "overrides": {"mobility_buffer_ms": 1234}},
+        headers=_AUTH_HEADER,
+    )
+    page = testing_client.get("/accessibility", headers=_AUTH_HEADER)
+    assert b'value="1234"' in page.data
+
+
+def test_content_page_cache_follows_pack_listing(
+    client: Any, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The content page keeps one cache entry and re-renders when packs come and go."""
+    testing_client, _controller, _path = client
+    ctx = testing_client.application.config["DASHBOARD_CONTEXT"]
+    packs_root = tmp_path / "packs"
+    (packs_root / "alpha").mkdir(parents=True)
+    original_root = ctx.content_manager._packs_root
+    monkeypatch.setattr(ctx.content_manager, "_packs_root", packs_root)
+
+    assert b"alpha" in testing_client.get("/content", headers=_AUTH_HEADER).data
+    (packs_root / "beta").mkdir()
+    assert b"beta" in testing_client.get("/content", headers=_AUTH_HEADER).data
+
+    content_keys = [key for key in ctx.api_cache._entries if key.startswith("page:content")]
+    assert content_keys == ["page:content"]
+
+    monkeypatch.setattr(ctx.content_manager, "_packs_root", original_root)
+    ctx.refresh_content()
+    assert "page:content" not in ctx.api_cache._entries
+
+
+def test_oversized_json_body_rejected(client) -> None:
+    """Bodies above the JSON size limit are refused before parsing."""
+    testing_client, _controller, _path = client
+    import hub.dashboard_app as dashboard_app
+
+    padding = "x" * (dashboard_app.MAX_JSON_BYTES + 1)
+    response = testing_client.post(
+        "/api/select-pack",
+        json={"pack_name": padding},
+        headers=_AUTH_HEADER,
+    )
+    assert response.status_code == 413
+
+
+def test_yaml_profiles_with_non_string_keys_serialise(client: Any) -> None:
+    """Profile keys YAML parses as ints or bools still encode in API responses."""
+    testing_client, _controller, profiles_path = client
+    with profiles_path.open("rb") as handle:
+        profiles = yaml.load(handle, Loader=YAML_LOADER) or {}  # noqa: S506
+    profiles.setdefault("global", {})[1] = "legacy"
+    profiles_path.write_text(yaml.safe_dump(profiles), encoding="utf-8")
+    testing_client.application.config["DASHBOARD_CONTEXT"].reload_accessibility()
+
+    response = testing_client.post(
+        "/api/apply-preset", json={"global": {"pace": 1.0}}, headers=_AUTH_HEADER
+    )
+    assert response.status_code == 200
+    assert response.get_json()["global"]["1"] == "legacy"
+
+
+def test_oversized_chunked_json_body_rejected(client: Any) -> None:
+    """Bodies without a Content-Length are cut off at the size limit."""
+    testing_client, _controller, _path = client
+    import hub.dashboard_app as dashboard_app
+
+    body = io.BytesIO(b'{"pack_name": "' + b"x" * (dashboard_app.MAX_JSON_BYTES * 4) + b'"}')
+    response = testing_client.post(
+        "/api/select-pack",
+        input_stream=body,
+        content_type="application/json",
+        headers={**_AUTH_HEADER, "Transfer-Encoding": "chunked"},
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+    assert response.status_code == 413
+    assert body.tell() <= dashboard_app.MAX_JSON_BYTES + 1
+
+
+def test_logout_challenges_without_credentials(client) -> None:
+    """With auth enabled, logout answers a Basic challenge so browsers drop credentials."""
+    testing_client, _controller, _path = client
+    response = testing_client.get("/logout")
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"].startswith("Basic")
+
+
+def test_logout_redirects_when_auth_disabled() -> None:
+    """Without configured credentials, logout returns to the dashboard instead of challenging."""
+    import hub.dashboard_app as dashboard_app
+    from hub.config_loader import load_config
+
+    config = load_config()
+    config = dataclasses.replace(
+        config, security=dataclasses.replace(config.security, require_basic_auth=False)
+    )
+    app = dashboard_app.create_app(config=config)
+    response = app.test_client().get("/logout")
+    assert response.status_code == 302
+    assert "WWW-Authenticate" not in response.headers
@@ -0,0 +1,77 @@
+"""Tests for the buffered CSV event logger."""
+
+from __future__ import annotations
+
+import csv
+import datetime as dt
+from pathlib import Path
+
+from hub.event_logging import CsvEventLogger, latest_event_csv
+
+
+def _rows(logs_dir: Path) -> list[dict[str, str]]:
+    log_path = latest_event_csv(logs_dir)
+    assert log_path is not None
+    with log_path.open("r", encoding="utf-8", newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+def test_events_are_flushed_in_batches(tmp_path: Path) -> None:
+    """Rows reach disk once the batch fills, without waiting for close."""
+    logger = CsvEventLogger(tmp_path, batch_size=2, flush_interval=60.0)
+    logger.record_event("fragment_triggered", "object1", "{}")
+    assert _rows(tmp_path) == []
+
+    logger.record_event("fragment_triggered", "object2", "{}")
+    assert [row["node_id"] for row in _rows(tmp_path)] == ["object1", "object2"]
+    logger.close()
+
+
+def test_close_drains_buffered_events(tmp_path: Path) -> None:
+    """Closing the logger writes out anything still buffered."""
+    logger = CsvEventLogger(tmp_path, batch_size=100, flush_interval=60.0)
+    logger.record_event("heartbeat_received", "object1", '{"ts": 1}')
+    logger.close()
+
+    rows = _rows(tmp_path)
+    assert rows[0]["event"] == "heartbeat_received"
+    assert rows[0]["detail"] == '{"ts": 1}'
+
+
+def test_rows_round_trip_through_csv_reader(tmp_path: Path) -> None:
+    """Hand-formatted rows must quote commas, quotes, and newlines like csv does."""
+    logger = CsvEventLogger(tmp_path)
+    detail = '{"note": "a, b", "text": "line1\nline2"}'
+    logger.record_event("admin_action", "node,1", detail)
+    logger.close()
+
+    (row,) = _rows(tmp_path)
+    assert row["node_id"] == "node,1"
+    assert row["detail"] == detail
+
+
+def test_timestamps_are_utc_iso8601(tmp_path: Path) -> None:
+    """Row timestamps parse as timezone-aware UTC datetimes close to now."""
+    logger = CsvEventLogger(tmp_path)
+    before = dt.datetime.now(tz=dt.timezone.utc)
+    logger.record_event("admin_action", "hub", "reset")
+    logger.close()
+
+    (row,) = _rows(tmp_path)
+    stamp = dt.datetime.fromisoformat(row["timestamp"])
+    assert stamp.utcoffset() == dt.timedelta(0)
+    assert abs((stamp - before).total_seconds()) < 5
+    assert _rows(tmp_path) and (tmp_path / f"{stamp.date().isoformat()}_events.csv").exists()
+
+
+def test_latest_csv_prefers_the_open_file(tmp_path: Path) -> None:
+    """The logger reports its own daily file, falling back to the newest on disk."""
+    (tmp_path / "2000-01-01_events.csv").write_text("timestamp,event,node_id,detail\n")
+    logger = CsvEventLogger(tmp_path)
+    assert logger.latest_csv() == tmp_path / "2000-01-01_events.csv"
+
+    logger.record_event("admin_action", "hub", "reset")
+    current = logger.latest_csv()
+    assert current is not None and current.name != "2000-01-01_events.csv"
+    logger.close()
+    assert logger.latest_csv() == current
@@ -0,0 +1,35 @@
+"""Tests for the haptic pulse helper."""
+
+from __future__ import annotations
+
+from typing import Any, List
+
+from pi_nodes.haptics import Haptics
+
+
+class RecordingDevice:
+    """Output device stand-in that records the calls it receives."""
+
+    def __init__(self) -> None:
+        self.calls: List[tuple[str, Any]] = []
+
+    def on(self) -> None:
+        self.calls.append(("on", None))
+
+    def off(self) -> None:
+        self.calls.append(("off", None))
+
+    def blink(self, on_time: float, off_time: float, n: int | None = None) -> None:
+        self.calls.append(("blink", on_time))
+
+
+def test_short_pulses_toggle_the_pin_inline() -> None:
+    """Brief pulses switch the motor directly instead of starting a blink thread."""
+    haptics = Haptics(pin=5)
+    device = RecordingDevice()
+    haptics._device = device  # type: ignore[assignment]
+
+    haptics.pulse(10)
+    haptics.pulse(180)
+
+    assert device.calls == [("on", None), ("off", None), ("blink", 0.18)]
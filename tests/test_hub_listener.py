@@ -0,0 +1,140 @@
+"""Tests for MQTT message handling in the hub listener."""
+
+from __future__ import annotations
+
+import csv
+import dataclasses
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("paho.mqtt.client")
+
+from hub.config_loader import load_config  # noqa: E402
+from hub.hub_listener import HubListener  # noqa: E402
+from hub.mqtt_topics import (  # noqa: E402
+    health_topic,
+    hub_state_topic,
+    node_ack_topic,
+    node_config_topic,
+    trigger_topic,
+)
+
+
+class FakeClient:
+    """Record publishes instead of talking to a broker."""
+
+    def __init__(self) -> None:
+        self.published: list[tuple[str, Any]] = []
+        self.on_connect: Any = None
+        self.on_message: Any = None
+
+    def publish(self, topic: str, payload: Any, qos: int = 0, retain: bool = False) -> Any:
+        self.published.append((topic, payload))
+        return SimpleNamespace(rc=0)
+
+
+def _listener(tmp_path: Path) -> tuple[HubListener, Any]:
+    config = dataclasses.replace(load_config(), logs_dir=tmp_path)
+    client: Any = FakeClient()
+    return HubListener(config, mqtt_client=client), client
+
+
+def _message(topic: str, payload: bytes) -> Any:
+    return SimpleNamespace(topic=topic, payload=payload)
+
+
+def _logged_events(logs_dir: Path) -> list[dict[str, str]]:
+    (log_path,) = logs_dir.glob("*_events.csv")
+    with log_path.open("r", encoding="utf-8", newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+def test_trigger_message_updates_state_and_publishes(tmp_path: Path) -> None:
+    """A trigger is recorded, registered, and rebroadcast as hub state."""
+    listener, client = _listener(tmp_path)
+    listener._on_message(client, None, _message(trigger_topic("object1"), b'{"lang": "en"}'))
+
+    assert listener.get_state_snapshot()["triggered"] == ["object1"]
+    topic, payload = client.published[-1]
+    assert topic == hub_state_topic()
+    assert b"object1" in bytes(payload)
+
+    listener._event_logger.close()
+    events = _logged_events(tmp_path)
+    assert events[0]["event"] == "fragment_triggered"
+    assert events[0]["detail"] == '{"lang": "en"}'
+
+
+def test_invalid_health_payload_is_logged(tmp_path: Path) -> None:
+    """Malformed heartbeats are logged without updating node health."""
+    listener, client = _listener(tmp_path)
+    listener._on_message(client, None, _message(health_topic("object1"), b"{not json"))
+
+    assert listener.get_health_snapshot() == {}
+    listener._event_logger.close()
+    assert _logged_events(tmp_path)[0]["detail"] == "invalid_json"
+
+
+def test_non_utf8_trigger_payload_is_rejected(tmp_path: Path) -> None:
+    """Undecodable trigger bytes are logged as invalid rather than raising."""
+    listener, client = _listener(tmp_path)
+    listener._on_message(client, None, _message(trigger_topic("object1"), b"\xff\xfe"))
+
+    assert listener.get_state_snapshot()["triggered"] == []
+    listener._event_logger.close()
+    assert _logged_events(tmp_path)[0]["detail"] == "invalid_json"
+
+
+def test_health_snapshot_reports_age_from_heartbeat_ts(tmp_path: Path) -> None:
+    """Heartbeat epochs become per-node ages in the health snapshot."""
+    listener, client = _listener(tmp_path)
+    sent_at = time.time() - 30
+    payload = f'{{"ts": {sent_at}}}'.encode()
+    listener._on_message(client, None, _message(health_topic("object1"), payload))
+
+    age = listener.get_health_snapshot()["object1"]
+    assert 29 <= age < 40
+    listener._event_logger.close()
+
+
+def test_unrelated_topics_are_ignored(tmp_path: Path) -> None:
+    """Messages outside the subscribed topic families do not reach any handler."""
+    listener, client = _listener(tmp_path)
+    listener._on_message(client, None, _message("ECHOTRACE/trigger/a/b", b"{}"))
+    listener._on_message(client, None, _message("OTHER/trigger/object1", b"{}"))
+
+    assert listener.get_state_snapshot()["triggered"] == []
+    assert client.published == []
+    listener._event_logger.close()
+
+
+def test_push_node_config_waits_for_ack(tmp_path: Path) -> None:
+    """A config push succeeds once the node acknowledges and times out otherwise."""
+    listener, client = _listener(tmp_path)
+    ack = _message(node_ack_topic("object1"), b'{"ok": true}')
+    timer = threading.Timer(0.05, listener._on_message, args=(client, None, ack))
+    timer.start()
+
+    assert listener.push_node_config("object1", {"volume": 0.5}, timeout=2.0) is True
+    timer.join()
+    assert client.published[0] == (node_config_topic("object1"), b'{"volume":0.5}')
+
+    assert listener.push_node_config("object2", {}, timeout=0.01) is False
+    listener._event_logger.close()
+
+
+def test_duplicate_trigger_does_not_republish_state(tmp_path: Path) -> None:
+    """Unchanged narrative state is published once, not per duplicate trigger."""
+    listener, client = _listener(tmp_path)
+    trigger = _message(trigger_topic("object1"), b"{}")
+    listener._on_message(client, None, trigger)
+    listener._on_message(client, None, trigger)
+
+    state_publishes = [topic for topic, _ in client.published if topic == hub_state_topic()]
+    assert len(state_publishes) == 1
+    listener._event_logger.close()
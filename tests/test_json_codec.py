@@ -0,0 +1,38 @@
+"""Tests for the hub and node JSON codecs."""
+
+from __future__ import annotations
+
+import json
+from types import ModuleType
+
+import pytest
+
+from hub import json_codec as hub_codec
+from pi_nodes import json_codec as node_codec
+
+
+_CODECS = {"hub": hub_codec, "node": node_codec}
+
+
+@pytest.fixture(params=["hub-orjson", "hub-stdlib", "node-orjson", "node-stdlib"])
+def codec(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    package, backend = str(request.param).split("-")
+    module = _CODECS[package]
+    if backend == "orjson":
+        if module.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(module, "orjson", None)
+    return module
+
+
+def test_non_string_keys_are_stringified(codec: ModuleType) -> None:
+    """YAML-derived mappings with int, bool, and null keys encode on either backend."""
+    payload = {1: "one", False: "no", None: "nothing", "name": "object1"}
+    assert json.loads(codec.dumps(payload)) == json.loads(json.dumps(payload))
+
+
+def test_unsupported_values_raise_type_error(codec: ModuleType) -> None:
+    """Values JSON cannot represent fail the same way on either backend."""
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
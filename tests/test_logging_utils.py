@@ -0,0 +1,32 @@
+"""Tests for node logging configuration."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from pi_nodes import logging_utils
+
+
+def test_records_are_written_by_the_queue_listener(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Errors logged on the caller thread reach the rotating file via the listener."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    log_file = tmp_path / "logs" / "node.log"
+
+    logging_utils.configure_node_logging(log_file)
+    assert logging_utils._LISTENER is not None
+    assert [type(handler) for handler in root.handlers] == [logging.handlers.QueueHandler]
+
+    logging.getLogger("pi_nodes.test").info("routine detail")
+    logging.getLogger("pi_nodes.test").error("audio dropout")
+    logging_utils._stop_listener()
+
+    contents = log_file.read_text(encoding="utf-8")
+    assert "ERROR [pi_nodes.test] audio dropout" in contents
+    assert "routine detail" not in contents
@@ -0,0 +1,19 @@
+"""Tests keeping the hub and node MQTT topic helpers aligned."""
+
+from __future__ import annotations
+
+from hub import mqtt_topics as hub_topics
+from pi_nodes import mqtt_topics as node_topics
+
+
+def test_node_topic_set_matches_hub_topics() -> None:
+    """The node's precomputed topics are the ones the hub subscribes and publishes to."""
+    topics = node_topics.build_node_topics("object1")
+
+    assert topics.health == hub_topics.health_topic("object1")
+    assert topics.trigger == hub_topics.trigger_topic("object1")
+    assert topics.config == hub_topics.node_config_topic("object1")
+    assert topics.ack == hub_topics.node_ack_topic("object1")
+    assert topics.hub_state == hub_topics.hub_state_topic()
+    assert node_topics.build_node_topics("object1") is topics
+    assert node_topics.health_topic("object1") == topics.health
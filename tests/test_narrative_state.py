@@ -22,3 +22,32 @@ def test_narrative_unlocks_after_required_triggers() -> None:
     state.reset()
     assert state.unlocked is False
     assert state.snapshot()["triggered"] == []
+
+
+def test_snapshot_lists_are_independent_copies() -> None:
+    """Cached ordering must not leak mutations between snapshots."""
+    state = NarrativeState(required_fragments=3)
+    state.register_trigger("b")
+    state.register_trigger("a")
+    first = state.snapshot()["triggered"]
+    assert first == ["a", "b"]
+    first.append("mutated")  # type: ignore[attr-defined]
+
+    state.register_trigger("c")
+    assert state.snapshot()["triggered"] == ["a", "b", "c"]
+
+
+def test_payload_tracks_unlock_and_reset() -> None:
+    """Encoded state is rebuilt after unlock and reset but reused for duplicates."""
+    state = NarrativeState(required_fragments=1)
+    initial = state.payload_bytes()
+    assert state.payload_bytes() is initial
+
+    state.register_trigger("node1")
+    unlocked = state.payload_bytes()
+    assert b'"unlocked":true' in unlocked
+    state.register_trigger("node1")
+    assert state.payload_bytes() is unlocked
+
+    state.reset()
+    assert state.snapshot() == {"unlocked": False, "triggered": []}
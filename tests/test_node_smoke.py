@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Any, List, Optional, Sequence, Tuple
 
 import pytest
 
@@ -15,6 +16,7 @@ from pi_nodes.mqtt_topics import (
     node_config_topic,
     trigger_topic,
 )
+from pi_nodes import node_service
 from pi_nodes.node_service import HEARTBEAT_INTERVAL_SECONDS, NodeService
 from pi_nodes.proximity_sensor import MockProximitySensor
 
@@ -92,7 +94,11 @@ class DummyHaptics:
         pass
 
 
-def _write_config(tmp_path: Path, overrides: Optional[dict[str, Any]] = None) -> Path:
+def _write_config(
+    tmp_path: Path,
+    overrides: Optional[dict[str, Any]] = None,
+    filename: str = "node_config.json",
+) -> Path:
     base = {
         "node_id": "test-node",
         "role": "whisper",
@@ -120,103 +126,205 @@ def _write_config(tmp_path: Path, overrides: Optional[dict[str, Any]] = None) ->
     }
     if overrides:
         base.update(overrides)
-    config_path = tmp_path / "node_config.yaml"
+    config_path = tmp_path / filename
     config_path.write_text(json.dumps(base), encoding="utf-8")
     return config_path
 
 
-def test_node_service_emits_heartbeat(tmp_path: Path) -> None:
-    """Heartbeat should publish to the expected MQTT topic."""
-    audio_file = tmp_path / "clip.mp3"
-    audio_file.write_text("dummy", encoding="utf-8")
-    config_path = _write_config(tmp_path)
+@pytest.fixture
+def fakes() -> SimpleNamespace:
+    """Fresh hardware and broker stubs for one node service."""
+    return SimpleNamespace(
+        mqtt=FakeMQTT(), audio=DummyAudio(), led=DummyLED(), haptics=DummyHaptics()
+    )
 
-    mqtt_client = FakeMQTT()
-    audio = DummyAudio()
-    service = NodeService(
+
+@pytest.fixture(scope="module")
+def config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A default whisper config and its clip, written once for read-only tests."""
+    config_dir = tmp_path_factory.mktemp("node")
+    (config_dir / "clip.mp3").write_text("dummy", encoding="utf-8")
+    return _write_config(config_dir)
+
+
+def _service(
+    config_path: Path, fakes: SimpleNamespace, readings: Sequence[int] = (900,)
+) -> NodeService:
+    return NodeService(
         config_path=config_path,
-        sensor=MockProximitySensor([900]),
-        audio_player=audio,
-        led_feedback=DummyLED(),
-        haptics=DummyHaptics(),
-        mqtt_client=mqtt_client,
+        sensor=MockProximitySensor(readings),
+        audio_player=fakes.audio,
+        led_feedback=fakes.led,
+        haptics=fakes.haptics,
+        mqtt_client=fakes.mqtt,
     )
 
+
+def test_node_service_emits_heartbeat(config_path: Path, fakes: SimpleNamespace) -> None:
+    """Heartbeat should publish to the expected MQTT topic."""
+    service = _service(config_path, fakes)
+
     service._last_heartbeat_ts = -HEARTBEAT_INTERVAL_SECONDS  # force immediate heartbeat
     service.run_once(now=0.0)
 
-    assert any(topic == health_topic("test-node") for topic, _ in mqtt_client.published)
+    assert any(topic == health_topic("test-node") for topic, _ in fakes.mqtt.published)
 
 
-def test_whisper_node_triggers_story(tmp_path: Path) -> None:
+def test_whisper_node_triggers_story(config_path: Path, fakes: SimpleNamespace) -> None:
     """Crossing the story threshold should publish trigger and play audio."""
-    audio_file = tmp_path / "clip.mp3"
-    audio_file.write_text("dummy", encoding="utf-8")
-    config_path = _write_config(tmp_path)
-
-    mqtt_client = FakeMQTT()
-    audio = DummyAudio()
-    led = DummyLED()
-    sensor = MockProximitySensor([900, 650])
-
-    service = NodeService(
-        config_path=config_path,
-        sensor=sensor,
-        audio_player=audio,
-        led_feedback=led,
-        haptics=DummyHaptics(),
-        mqtt_client=mqtt_client,
-    )
+    service = _service(config_path, fakes, [900, 650])
 
     service.run_once(now=0.0)  # ambient pass
     service.run_once(now=1.0)  # should trigger
 
-    assert audio.play_calls, "Audio play should be invoked."
-    assert any(topic == trigger_topic("test-node") for topic, _ in mqtt_client.published)
+    assert fakes.audio.play_calls, "Audio play should be invoked."
+    assert any(topic == trigger_topic("test-node") for topic, _ in fakes.mqtt.published)
 
 
-def test_config_update_applies_and_acknowledges(tmp_path: Path) -> None:
+def test_config_update_applies_and_acknowledges(
+    config_path: Path, fakes: SimpleNamespace
+) -> None:
     """Node should honour runtime configuration updates."""
-    audio_file = tmp_path / "clip.mp3"
-    audio_file.write_text("dummy", encoding="utf-8")
-    config_path = _write_config(tmp_path)
-
-    mqtt_client = FakeMQTT()
-    audio = DummyAudio()
-
-    service = NodeService(
-        config_path=config_path,
-        sensor=MockProximitySensor([900]),
-        audio_player=audio,
-        led_feedback=DummyLED(),
-        haptics=DummyHaptics(),
-        mqtt_client=mqtt_client,
-    )
+    service = _service(config_path, fakes)
 
     payload = json.dumps({"audio": {"volume": 0.4}})
     service.handle_mqtt_message(node_config_topic("test-node"), payload)
 
     assert pytest.approx(service.config.audio.volume, rel=1e-3) == 0.4
-    assert any(topic == node_ack_topic("test-node") for topic, _ in mqtt_client.published)
+    assert any(topic == node_ack_topic("test-node") for topic, _ in fakes.mqtt.published)
 
 
-def test_mystery_node_plays_on_unlock(tmp_path: Path) -> None:
+def test_mystery_node_plays_on_unlock(tmp_path: Path, fakes: SimpleNamespace) -> None:
     """Mystery nodes play finale audio when the hub publishes an unlocked state."""
     audio_file = tmp_path / "finale.mp3"
     audio_file.write_text("dummy", encoding="utf-8")
-    config_path = _write_config(tmp_path, {"role": "mystery"})
+    service = _service(_write_config(tmp_path, {"role": "mystery"}), fakes)
 
-    mqtt_client = FakeMQTT()
-    audio = DummyAudio()
+    service.handle_mqtt_message(hub_state_topic(), json.dumps({"unlocked": True}))
+    assert fakes.audio.play_calls, "Mystery node should play audio when unlocked."
 
-    service = NodeService(
-        config_path=config_path,
-        sensor=MockProximitySensor([900]),
-        audio_player=audio,
-        led_feedback=DummyLED(),
-        haptics=DummyHaptics(),
-        mqtt_client=mqtt_client,
+
+def test_config_reload_picks_up_file_changes(tmp_path: Path, fakes: SimpleNamespace) -> None:
+    """Cached config parses are reused only while the file is unchanged."""
+    config_path = _write_config(tmp_path)
+
+    first = _service(config_path, fakes)
+    first.config.audio.volume = 0.1
+    assert _service(config_path, fakes).config.audio.volume == 0.6
+
+    _write_config(tmp_path, {"node_id": "renamed-node"})
+    assert _service(config_path, fakes).config.node_id == "renamed-node"
+
+
+def test_glow_tracks_proximity_updates(config_path: Path, fakes: SimpleNamespace) -> None:
+    """Glow scales across the configured range and follows runtime proximity changes."""
+    service = _service(config_path, fakes)
+
+    assert service._calculate_glow(50) == 1.0
+    assert service._calculate_glow(650) == pytest.approx(0.5)
+    assert service._calculate_glow(5000) == 0.0
+
+    payload = json.dumps({"proximity": {"min_mm": 0, "max_mm": 1000}})
+    service.handle_mqtt_message(node_config_topic("test-node"), payload)
+    assert service._calculate_glow(250) == pytest.approx(0.75)
+
+
+def test_config_files_parse_by_suffix(tmp_path: Path) -> None:
+    """JSON and YAML node configs load to the same settings and leave no cache files."""
+    node_service._CONFIG_CACHE.clear()
+    json_path = _write_config(tmp_path)
+    yaml_path = _write_config(tmp_path, filename="node_config.yaml")
+
+    assert node_service._read_config_file(json_path) == node_service._read_config_file(yaml_path)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "node_config.json",
+        "node_config.yaml",
+    ]
+
+
+def test_config_updates_reach_audio_and_later_stories(
+    config_path: Path, fakes: SimpleNamespace
+) -> None:
+    """Volume and safety changes apply at once and persist into the next story."""
+    audio = fakes.audio
+    service = _service(config_path, fakes, [900, 650])
+
+    payload = json.dumps({"audio": {"volume": 0.9}, "accessibility": {"safety_limiter": True}})
+    service.handle_mqtt_message(node_config_topic("test-node"), payload)
+    assert audio.volume == pytest.approx(0.9)
+    assert audio.safety_limit == pytest.approx(0.75)
+
+    audio.volume = 0.0
+    service.run_once(now=0.0)
+    service.run_once(now=1.0)
+    assert audio.play_calls
+    assert audio.volume == pytest.approx(0.75)
+
+
+def test_config_ack_payload_is_valid_json(tmp_path: Path, fakes: SimpleNamespace) -> None:
+    """The spliced ack payload decodes to the same object the hub always received."""
+    service = _service(_write_config(tmp_path, {"node_id": 'quote"node'}), fakes)
+
+    service.handle_mqtt_message(node_config_topic('quote"node'), json.dumps({"proximity": {}}))
+
+    assert fakes.mqtt.published[-1] == (
+        node_ack_topic('quote"node'),
+        {"node_id": 'quote"node', "status": "ok", "applied": ["proximity"]},
     )
 
-    service.handle_mqtt_message(hub_state_topic(), json.dumps({"unlocked": True}))
-    assert audio.play_calls, "Mystery node should play audio when unlocked."
+
+def test_heartbeat_waits_for_broker_connection(config_path: Path, fakes: SimpleNamespace) -> None:
+    """No heartbeat is built while disconnected; it goes out soon after reconnecting."""
+    connected = False
+    fakes.mqtt.is_connected = lambda: connected
+    service = _service(config_path, fakes)
+
+    assert service.run_once(now=100.0)["heartbeat"] is None
+    connected = True
+    assert service.run_once(now=100.5)["heartbeat"] is None
+    assert service.run_once(now=101.0)["heartbeat"] is not None
+    assert [topic for topic, _ in fakes.mqtt.published] == [health_topic("test-node")]
+
+
+class ClosingSensor(MockProximitySensor):
+    """Mock sensor counting close() calls."""
+
+    def __init__(self) -> None:
+        super().__init__([900])
+        self.closed = 0
+
+    def close(self) -> None:
+        self.closed += 1
+        super().close()
+
+
+def test_shutdown_leaves_injected_sensor_open(
+    config_path: Path, fakes: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Injected sensors stay open; a service-created sensor is closed exactly once."""
+    injected = ClosingSensor()
+    kwargs: dict[str, Any] = {
+        "audio_player": fakes.audio,
+        "led_feedback": fakes.led,
+        "haptics": fakes.haptics,
+        "mqtt_client": fakes.mqtt,
+    }
+    NodeService(config_path=config_path, sensor=injected, **kwargs).shutdown()
+    assert injected.closed == 0
+
+    monkeypatch.setattr(node_service, "ProximitySensor", ClosingSensor)
+    service = NodeService(config_path=config_path, **kwargs)
+    service.shutdown()
+    service.shutdown()
+    assert service._sensor.closed == 1  # type: ignore[attr-defined]
+
+
+def test_sensor_close_is_idempotent() -> None:
+    """Closing stops ranging once; repeated closes do nothing."""
+    stops: List[str] = []
+    sensor = MockProximitySensor([900])
+    sensor._sensor = SimpleNamespace(stop_ranging=lambda: stops.append("stop"))
+
+    sensor.close()
+    sensor.close()
+    assert stops == ["stop"]
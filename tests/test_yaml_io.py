@@ -0,0 +1,70 @@
+"""Tests for the shared YAML loading helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import yaml  # type: ignore[import]
+
+from hub.yaml_io import dump_yaml, load_yaml, sidecar_path, store_sidecar
+
+
+def test_load_yaml_writes_and_reuses_sidecar(tmp_path: Path) -> None:
+    """A parsed YAML file should be cached as JSON and served from it next time."""
+    source = tmp_path / "config.yaml"
+    source.write_text("name: pack\ncount: 3\n", encoding="utf-8")
+
+    assert load_yaml(source) == {"name": "pack", "count": 3}
+    sidecar = sidecar_path(source)
+    cached = json.loads(sidecar.read_text(encoding="utf-8"))
+
+    cached["data"] = {"name": "from-sidecar"}
+    sidecar.write_text(json.dumps(cached), encoding="utf-8")
+    assert load_yaml(source) == {"name": "from-sidecar"}
+
+
+def test_load_yaml_ignores_stale_sidecar(tmp_path: Path) -> None:
+    """Edits to the YAML source must win over a sidecar built from older contents."""
+    source = tmp_path / "config.yaml"
+    source.write_text("name: old\n", encoding="utf-8")
+    assert load_yaml(source) == {"name": "old"}
+
+    source.write_text("name: fresh\n", encoding="utf-8")
+    assert load_yaml(source) == {"name": "fresh"}
+
+
+def test_load_yaml_skips_sidecar_for_non_string_keys(tmp_path: Path) -> None:
+    """Documents that JSON cannot represent losslessly are never cached."""
+    source = tmp_path / "config.yaml"
+    source.write_text("1: one\n", encoding="utf-8")
+
+    assert load_yaml(source) == {1: "one"}
+    assert not sidecar_path(source).exists()
+
+
+def test_store_sidecar_matches_saved_yaml(tmp_path: Path) -> None:
+    """A sidecar stored right after a save is trusted by the next load."""
+    source = tmp_path / "profiles.yaml"
+    source.write_text("global:\n  captions: true\n", encoding="utf-8")
+
+    store_sidecar(source, {"global": {"captions": True}})
+
+    cached = json.loads(sidecar_path(source).read_text(encoding="utf-8"))
+    assert cached["data"] == {"global": {"captions": True}}
+    assert load_yaml(source) == {"global": {"captions": True}}
+
+
+def test_dump_yaml_replaces_file_and_leaves_no_temp(tmp_path: Path) -> None:
+    """Saves land atomically and refresh the sidecar for the new contents."""
+    target = tmp_path / "profiles.yaml"
+    target.write_text("old: true\n", encoding="utf-8")
+
+    dump_yaml(target, {"new": 1})
+
+    assert yaml.safe_load(target.read_text(encoding="utf-8")) == {"new": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "profiles.yaml",
+        "profiles.yaml.json",
+    ]
+    assert load_yaml(target) == {"new": 1}